@@ -1,11 +1,25 @@
 import os
+import re
 import json
+import atexit
+import fcntl
+import functools
+import hashlib
+import hmac
+import heapq
+import mmap
 import shutil
 import time
 import threading
 import uuid
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from datetime import datetime, timezone, date, timedelta
+from datetime import datetime, timezone, date
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
 from flask import Flask, jsonify, request, send_from_directory, render_template
 
 app = Flask(__name__)
@@ -13,26 +27,95 @@ app = Flask(__name__)
 DATA_DIR = Path(os.environ.get("DATA_DIR", Path.home() / "Intelligence-Briefings"))
 EPISODES_DIR = DATA_DIR / "episodes"
 TOPICS_CACHE = DATA_DIR / "topics_cache.json"
+SUGGESTIONS_CACHE = DATA_DIR / "suggestions_cache.json"
+EDITORIAL_CONTEXT_FILE = DATA_DIR / "editorial_context.json"
+TRAILER_QUEUE_LOG = DATA_DIR / "nightly_trailer_log.json"
+MORNING_PREP_LOG = DATA_DIR / "morning_prep_log.json"
 FEED_FILE = DATA_DIR / "feed.xml"
-EPISODES_JSON = DATA_DIR / "episodes.json"
-PRODUCTION_LOG = DATA_DIR / "production_log.json"
+FEED_ETAG_FILE = DATA_DIR / "feed.etag"
+EPISODES_LOG = DATA_DIR / "episodes.jsonl"
+LEGACY_EPISODES_JSON = DATA_DIR / "episodes.json"
+PRODUCTION_LOG = DATA_DIR / "production_log.jsonl"
+LEGACY_PRODUCTION_LOG = DATA_DIR / "production_log.json"
 JOBS_FILE = DATA_DIR / "jobs.json"
 SERIES_FILE = DATA_DIR / "series.json"
-ENGAGEMENT_LOG = DATA_DIR / "engagement_log.json"
+ENGAGEMENT_LOG = DATA_DIR / "engagement_log.jsonl"
+LEGACY_ENGAGEMENT_LOG = DATA_DIR / "engagement_log.json"
+
+def _jloads(path):
+    return orjson.loads(path.read_bytes())
+
+def _jloads_mapped(path):
+    """Like _jloads, but parses straight from a read-only mapping of the file
+    instead of copying it into a bytes object first."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"{path.name} is empty")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+def _atomic_write_bytes(path, data):
+    """Write to a sibling temp file and swap it in, so readers never see a torn file."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+# State files are machine-written; set DEBUG_PRETTY=1 to indent them for inspection.
+_JSON_DUMP_OPTS = orjson.OPT_INDENT_2 if os.environ.get("DEBUG_PRETTY") else 0
+
+def _jdumps(path, obj):
+    _atomic_write_bytes(path, orjson.dumps(obj, option=_JSON_DUMP_OPTS))
 
 # ---------------------------------------------------------------------------
 # ENGAGEMENT LOG
 # ---------------------------------------------------------------------------
 
+ENGAGEMENT_MAX_EVENTS = 2000
+_ENGAGEMENT_COMPACT_BYTES = 512 * 1024
+_ENGAGEMENT_COMPACT_EVERY = 100
+
+ENGAGEMENT_FLUSH_INTERVAL = 5
+
 _engagement_lock = threading.Lock()
+# Cross-worker lock for appends and compaction; a sibling file because compaction
+# replaces the log's inode
+ENGAGEMENT_LOCK_FILE = DATA_DIR / "engagement_log.lock"
+_engagement_writes = 0
+# Write-behind buffer: requests enqueue, _engagement_flusher appends in batches
+_engagement_queue = deque(maxlen=10_000)
+_engagement_dirty = threading.Event()
+
+def _migrate_legacy_engagement():
+    """One-time conversion of the old JSON-array log to JSONL."""
+    if ENGAGEMENT_LOG.exists() or not LEGACY_ENGAGEMENT_LOG.exists():
+        return
+    try:
+        events = _jloads(LEGACY_ENGAGEMENT_LOG)
+        _atomic_write_bytes(ENGAGEMENT_LOG, b"".join(orjson.dumps(e) + b"\n" for e in events))
+        print(f"[ENGAGEMENT] Migrated {len(events)} events to {ENGAGEMENT_LOG.name}")
+    except Exception as e:
+        print(f"[ENGAGEMENT] Legacy log migration failed: {e}")
 
 def load_engagement():
     if not ENGAGEMENT_LOG.exists():
-        return []
-    try:
-        return json.loads(ENGAGEMENT_LOG.read_text())
-    except Exception:
-        return []
+        return list(_engagement_queue)[-ENGAGEMENT_MAX_EVENTS:]
+    events = []
+    with open(ENGAGEMENT_LOG, "rb") as f:
+        for line in f:
+            try:
+                events.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
+                continue
+    events.extend(list(_engagement_queue))
+    return events[-ENGAGEMENT_MAX_EVENTS:]
+
+def _maybe_compact_engagement():
+    """Trim the log to the newest events once it grows past the size threshold.
+    Caller holds the engagement file lock, so no worker appends mid-rewrite."""
+    if ENGAGEMENT_LOG.stat().st_size <= _ENGAGEMENT_COMPACT_BYTES:
+        return
+    lines = ENGAGEMENT_LOG.read_bytes().splitlines(keepends=True)
+    _atomic_write_bytes(ENGAGEMENT_LOG, b"".join(lines[-ENGAGEMENT_MAX_EVENTS:]))
 
 def save_engagement_event(event_type, topic_title, episode_id=None, pct=None, extra=None):
     event = {
@@ -43,53 +126,131 @@ def save_engagement_event(event_type, topic_title, episode_id=None, pct=None, ex
     if episode_id: event["episode_id"] = episode_id
     if pct is not None: event["pct"] = pct
     if extra: event.update(extra)
+    _engagement_queue.append(event)
+    _engagement_dirty.set()
+
+def _coalesce_engagement(events):
+    """Collapse repeated play_pct pings for the same topic/episode into one event
+    carrying the highest pct, placed at the latest ping's position."""
+    out = []
+    last_pct = {}
+    for e in events:
+        if e["event_type"] == "play_pct":
+            key = (e["topic_title"], e.get("episode_id"))
+            prev = last_pct.get(key)
+            if prev is not None:
+                e["pct"] = max(e.get("pct") or 0, out[prev].get("pct") or 0)
+                out[prev] = None
+            last_pct[key] = len(out)
+        out.append(e)
+    return [e for e in out if e is not None]
+
+def _flush_engagement():
+    global _engagement_writes
     with _engagement_lock:
-        events = load_engagement()
-        events.append(event)
-        if len(events) > 2000:
-            events = events[-2000:]
-        ENGAGEMENT_LOG.write_text(json.dumps(events, indent=2))
+        events = []
+        while _engagement_queue:
+            events.append(_engagement_queue.popleft())
+        if not events:
+            return
+        events = _coalesce_engagement(events)
+        with open(ENGAGEMENT_LOCK_FILE, "ab") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            # Opened per batch: a compaction by either worker swaps the file out
+            with open(ENGAGEMENT_LOG, "ab") as f:
+                f.write(b"".join(orjson.dumps(e) + b"\n" for e in events))
+            before = _engagement_writes
+            _engagement_writes += len(events)
+            if _engagement_writes // _ENGAGEMENT_COMPACT_EVERY != before // _ENGAGEMENT_COMPACT_EVERY:
+                _maybe_compact_engagement()
+    _engagement_summary_cache["data"] = None
+
+def _engagement_flusher():
+    while True:
+        _engagement_dirty.wait()
+        time.sleep(ENGAGEMENT_FLUSH_INTERVAL)
+        _engagement_dirty.clear()
+        try:
+            _flush_engagement()
+        except Exception as e:
+            print(f"[ENGAGEMENT] Flush failed: {e}")
+
+threading.Thread(target=_engagement_flusher, daemon=True).start()
+atexit.register(_flush_engagement)
+
+_PREVIEWED, _COMMISSIONED, _DISMISSED, _COMPLETE = 1, 2, 4, 8
+_SIGNAL_BITS = {
+    "preview_started": _PREVIEWED,
+    "commissioned": _COMMISSIONED,
+    "dismissed": _DISMISSED,
+    "listen_complete": _COMPLETE,
+    "play_pct": 0,
+}
+
+_engagement_summary_cache = {"key": None, "data": None}
+
+def _engagement_summary_key():
+    try:
+        st = ENGAGEMENT_LOG.stat()
+        stat = (st.st_mtime_ns, st.st_size)
+    except FileNotFoundError:
+        stat = None
+    return stat, len(_engagement_queue)
 
 def get_engagement_summary():
+    """Rebuilt only when the log changes on disk (this worker's flush or another
+    worker's) or events are still queued here; a local flush also drops it."""
+    key = _engagement_summary_key()
+    if _engagement_summary_cache["data"] is not None and _engagement_summary_cache["key"] == key:
+        return _engagement_summary_cache["data"]
+    data = _build_engagement_summary()
+    _engagement_summary_cache.update(key=key, data=data)
+    return data
+
+def _build_engagement_summary():
     events = load_engagement()
     if not events:
         return {}
 
-    from collections import defaultdict
-    topic_signals = defaultdict(lambda: {
-        "previewed": False, "commissioned": False, "dismissed": False,
-        "max_pct": 0, "listen_complete": False
-    })
-
-    for e in events:
+    signals = {}    # topic -> bitmask of _SIGNAL_BITS
+    max_pct = {}
+    last_seen = {}  # topic -> index of its latest event; the log is append-ordered
+    for i, e in enumerate(events):
         t = e.get("topic_title", "")
         if not t: continue
         et = e.get("event_type", "")
-        if et == "preview_started":
-            topic_signals[t]["previewed"] = True
-        elif et == "commissioned":
-            topic_signals[t]["commissioned"] = True
-        elif et == "dismissed":
-            topic_signals[t]["dismissed"] = True
-        elif et == "play_pct":
-            topic_signals[t]["max_pct"] = max(topic_signals[t]["max_pct"], e.get("pct", 0))
-        elif et == "listen_complete":
-            topic_signals[t]["listen_complete"] = True
-            topic_signals[t]["max_pct"] = 100
-
-    strong_interest = [t for t, s in topic_signals.items()
-                       if s["listen_complete"] or s["max_pct"] >= 75]
-    moderate_interest = [t for t, s in topic_signals.items()
-                         if not s["dismissed"] and (s["previewed"] or s["max_pct"] >= 25)
-                         and t not in strong_interest]
-    dismissed = [t for t, s in topic_signals.items() if s["dismissed"]]
-
+        bit = _SIGNAL_BITS.get(et)
+        if bit is None: continue
+        signals[t] = signals.get(t, 0) | bit
+        last_seen[t] = i
+        if et == "play_pct":
+            pct = e.get("pct") or 0
+            if pct > max_pct.get(t, 0):
+                max_pct[t] = pct
+
+    def pct_of(t):
+        return 100 if signals[t] & _COMPLETE else max_pct.get(t, 0)
+
+    def is_moderate(t):
+        bits = signals[t]
+        return not bits & _DISMISSED and (bits & _PREVIEWED or pct_of(t) >= 25)
+
+    # Most recently active topics first
     return {
-        "strong_interest": strong_interest[-20:],
-        "moderate_interest": moderate_interest[-20:],
-        "dismissed": dismissed[-30:],
+        "strong_interest": heapq.nlargest(
+            20, (t for t in signals if pct_of(t) >= 75), key=last_seen.__getitem__),
+        "moderate_interest": heapq.nlargest(
+            20, (t for t in signals if pct_of(t) < 75 and is_moderate(t)), key=last_seen.__getitem__),
+        "dismissed": heapq.nlargest(
+            30, (t for t in signals if signals[t] & _DISMISSED), key=last_seen.__getitem__),
     }
 
+# Shared keep-alive connection pool for outbound HTTP (Anthropic, AR dashboard,
+# ElevenLabs health check, cost tracker). Sized for gthread workers plus series jobs.
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+_HTTP.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
 ELEVEN_API_KEY = os.environ.get("ELEVEN_LABS_API_KEY") or os.environ.get("ELEVENLABS_API_KEY", "")
 ANTHROPIC_API_KEY = os.environ.get("ANTHROPIC_API_KEY", "")
 
@@ -104,22 +265,20 @@ def _log_api_cost(provider, model, input_tokens, output_tokens, total_cost, late
             api_url = os.environ.get("COST_TRACKER_API_URL")
             if not api_url:
                 return
-            import urllib.request as _req
-            payload = json.dumps({
+            payload = orjson.dumps({
                 "provider": provider, "model": model,
                 "input_tokens": input_tokens, "output_tokens": output_tokens,
                 "total_cost": total_cost,
                 "latency_ms": latency_ms,
                 "tool": tool_name, "user": "system", "project": "content-intelligence",
                 "status": "success",
-            }).encode()
-            req = _req.Request(
+            })
+            _HTTP.post(
                 f"{api_url.rstrip('/')}/api/log",
                 data=payload,
                 headers={"Content-Type": "application/json"},
-                method="POST",
+                timeout=5,
             )
-            _req.urlopen(req, timeout=5)
         except Exception as e:
             import sys
             print(f"[cost-tracker] logging failed: {e}", file=sys.stderr)
@@ -143,35 +302,91 @@ BASE_URL = os.environ.get("BASE_URL", "https://intelligence-briefings-production
 for d in [DATA_DIR, EPISODES_DIR]:
     d.mkdir(parents=True, exist_ok=True)
 
+# Created once above; resolved once for send_from_directory
+_EPISODES_ROOT = str(EPISODES_DIR.resolve())
+
+
 # ---------------------------------------------------------------------------
 # JOB QUEUE
 # ---------------------------------------------------------------------------
 
 _jobs_lock = threading.Lock()
+_jobs_cache = None
+_jobs_mtime = None
+_jobs_pending = set()  # ids updated in memory but not yet written
+_jobs_dirty = threading.Event()
+JOBS_FLUSH_DELAY = 0.25
+MAX_JOBS = 200
 
 def _load_jobs():
     if not JOBS_FILE.exists():
         return {}
     try:
-        return json.loads(JOBS_FILE.read_text())
+        return _jloads(JOBS_FILE)
     except Exception:
         return {}
 
+def _jobs_file_mtime():
+    try:
+        return JOBS_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+def _get_jobs():
+    """In-memory jobs dict. gunicorn runs several workers that share jobs.json,
+    so a stat is kept to pick up their writes; the file is only re-parsed when
+    it actually changed. Unflushed local updates survive the reload.
+    Caller holds _jobs_lock."""
+    global _jobs_cache, _jobs_mtime
+    mtime = _jobs_file_mtime()
+    if _jobs_cache is None or mtime != _jobs_mtime:
+        fresh = _load_jobs()
+        if _jobs_cache is not None:
+            for jid in _jobs_pending:
+                if jid in _jobs_cache:
+                    fresh[jid] = _jobs_cache[jid]
+        _jobs_cache = fresh
+        _jobs_mtime = mtime
+    return _jobs_cache
+
 def _save_jobs(jobs):
-    if len(jobs) > 200:
-        sorted_keys = sorted(jobs, key=lambda k: jobs[k].get("created_at", ""))
-        for k in sorted_keys[:-200]:
+    global _jobs_mtime
+    if len(jobs) > MAX_JOBS:
+        oldest = heapq.nsmallest(len(jobs) - MAX_JOBS, jobs.items(),
+                                 key=lambda kv: kv[1].get("created_at", ""))
+        for k, _ in oldest:
             del jobs[k]
-    JOBS_FILE.write_text(json.dumps(jobs, indent=2))
+    _jdumps(JOBS_FILE, jobs)
+    _jobs_mtime = _jobs_file_mtime()
+    _jobs_pending.clear()
+
+def _jobs_flusher():
+    """Coalesces bursts of update_job progress ticks into a single write."""
+    while True:
+        _jobs_dirty.wait()
+        time.sleep(JOBS_FLUSH_DELAY)
+        with _jobs_lock:
+            _jobs_dirty.clear()
+            if _jobs_pending:
+                _save_jobs(_get_jobs())
+
+def _flush_jobs_at_exit():
+    with _jobs_lock:
+        if _jobs_pending:
+            _save_jobs(_get_jobs())
+
+threading.Thread(target=_jobs_flusher, daemon=True).start()
+atexit.register(_flush_jobs_at_exit)
 
 def create_job(job_type="generate", series_id=None, series_ep=None):
     job_id = str(uuid.uuid4())[:8]
+    now_iso = datetime.now(timezone.utc).isoformat()
     job = {
         "id": job_id,
         "type": job_type,
         "status": "queued",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "updated_at": datetime.now(timezone.utc).isoformat(),
+        "created_at": now_iso,
+        "updated_at": now_iso,
         "progress": "Queued...",
         "result": None,
         "error": None,
@@ -179,7 +394,7 @@ def create_job(job_type="generate", series_id=None, series_ep=None):
         "series_ep": series_ep,
     }
     with _jobs_lock:
-        jobs = _load_jobs()
+        jobs = _get_jobs()
         jobs[job_id] = job
         _save_jobs(jobs)
     return job_id
@@ -187,22 +402,30 @@ def create_job(job_type="generate", series_id=None, series_ep=None):
 def update_job(job_id, **kwargs):
     kwargs["updated_at"] = datetime.now(timezone.utc).isoformat()
     with _jobs_lock:
-        jobs = _load_jobs()
+        jobs = _get_jobs()
         if job_id in jobs:
             jobs[job_id].update(kwargs)
-            _save_jobs(jobs)
+            _jobs_pending.add(job_id)
+            _jobs_dirty.set()
 
 def get_job(job_id):
     with _jobs_lock:
-        return _load_jobs().get(job_id)
+        job = _get_jobs().get(job_id)
+        return dict(job) if job else None
+
+def get_jobs_bulk(job_ids):
+    """Copies of the known jobs among job_ids, from one locked snapshot."""
+    with _jobs_lock:
+        jobs = _get_jobs()
+        return {jid: dict(jobs[jid]) for jid in job_ids if jid in jobs}
 
 def get_all_jobs():
     with _jobs_lock:
-        return _load_jobs()
+        return {jid: dict(j) for jid, j in _get_jobs().items()}
 
 def clear_queue():
     with _jobs_lock:
-        jobs = _load_jobs()
+        jobs = _get_jobs()
         cleared = 0
         for jid in list(jobs.keys()):
             if jobs[jid]["status"] in ("queued", "error"):
@@ -215,23 +438,71 @@ def clear_queue():
 # PRODUCTION CAP
 # ---------------------------------------------------------------------------
 
-def get_production_log():
-    if not PRODUCTION_LOG.exists():
-        return []
+_production_cache = (None, [])  # (log mtime_ns, epoch seconds from the last 7 days)
+
+def _iso_to_epoch(ts):
+    return int(datetime.fromisoformat(ts).timestamp())
+
+def _migrate_legacy_production_log():
+    """One-time conversion of the old JSON array of ISO strings to one epoch second per line."""
+    if PRODUCTION_LOG.exists() or not LEGACY_PRODUCTION_LOG.exists():
+        return
     try:
-        return json.loads(PRODUCTION_LOG.read_text())
-    except Exception:
-        return []
+        log = _jloads(LEGACY_PRODUCTION_LOG)
+        _atomic_write_bytes(PRODUCTION_LOG, b"".join(b"%d\n" % _iso_to_epoch(ts) for ts in log))
+        print(f"[PRODUCTION] Migrated {len(log)} entries to {PRODUCTION_LOG.name}")
+    except Exception as e:
+        print(f"[PRODUCTION] Legacy log migration failed: {e}")
 
 def log_production():
-    log = get_production_log()
-    log.append(datetime.now(timezone.utc).isoformat())
-    PRODUCTION_LOG.write_text(json.dumps(log))
+    with open(PRODUCTION_LOG, "ab") as f:
+        f.write(b"%d\n" % int(time.time()))
+
+def _iter_lines_reversed(buf):
+    end = len(buf)
+    while end > 0:
+        start = buf.rfind(b"\n", 0, end) + 1
+        line = buf[start:end]
+        end = start - 1
+        if line.strip():
+            yield line
+
+def _parse_production_line(line):
+    if line.startswith(b'"'):  # ISO string written before the switch to epoch seconds
+        return _iso_to_epoch(orjson.loads(line))
+    return int(line)
+
+def _productions_since(cutoff):
+    """Entries are appended in time order, so scan back from the end of the
+    mapped file and stop at the first old one; older pages are never touched."""
+    recent = []
+    with open(PRODUCTION_LOG, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return recent
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in _iter_lines_reversed(mm):
+                try:
+                    ts = _parse_production_line(line)
+                except (orjson.JSONDecodeError, ValueError):
+                    continue
+                if ts <= cutoff:
+                    break
+                recent.append(ts)
+    return recent
 
 def productions_this_week():
-    log = get_production_log()
-    week_ago = datetime.now(timezone.utc) - timedelta(days=7)
-    return sum(1 for ts in log if datetime.fromisoformat(ts) > week_ago)
+    global _production_cache
+    cutoff = int(time.time()) - 7 * 86400
+    try:
+        mtime = PRODUCTION_LOG.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+    if mtime != _production_cache[0]:
+        _production_cache = (mtime, _productions_since(cutoff))
+    return sum(1 for ts in _production_cache[1] if ts > cutoff)
+
+_migrate_legacy_engagement()
+_migrate_legacy_production_log()
 
 # ---------------------------------------------------------------------------
 # EDITORIAL PROMPT
@@ -268,55 +539,144 @@ Return ONLY a valid JSON array of 6 objects, no markdown:
   "trailer_hook": "3-4 sentence spoken-word hook, direct to a peer executive"
 }]"""
 
-FALLBACK_TOPICS = [
-    {"rank":1,"title":"The Governance Tax: Why Most Enterprise AI Programs Are Paying for Risk They've Already Accepted","tension":"Organizations build elaborate AI governance frameworks after already deploying high-risk systems. The governance comes after the exposure, not before it.","why_it_matters":"Misaligned governance timing creates compliance theater that burns budget without reducing actual risk.","common_mistake":"Leaders treat governance as a launch gate rather than a continuous risk calibration process, which means controls are always one deployment behind actual exposure.","sub_questions":["At what point does governance reduce risk versus just document it?","How do you price retroactive governance versus pre-deployment friction?","What incentive structures cause governance teams to prioritize documentation over risk reduction?"],"trailer_hook":"Here's something nobody in your governance steering committee wants to say out loud: most enterprise AI governance programs are retroactive. You've already deployed the models. You've already accepted the risk. The frameworks you're building now are documentation for decisions already made. The real question is whether your governance creates actual risk reduction or just paper trails."},
-    {"rank":2,"title":"Agentic AI Broke Your ROI Model - And Your CFO Doesn't Know It Yet","tension":"Traditional ROI frameworks measure discrete outputs. Agentic AI generates value through non-linear, compounding processes largely invisible to standard measurement.","why_it_matters":"Executives who can't articulate agentic AI ROI in CFO terms will lose the budget war.","common_mistake":"Most analytics leaders retrofit agentic AI value into hours-saved metrics, which systematically undervalues compounding effects and undermines the investment case.","sub_questions":["What's the right unit of measurement for a system that improves its own decision quality over time?","How do you present agentic ROI to a CFO trained on capital budgeting?","What's the opportunity cost of NOT deploying agents while competitors do?"],"trailer_hook":"You cannot measure agentic AI the way you measured your last analytics platform. The value is in the loops - decisions made faster, signals never caught, systems learning at 3am. Your current ROI model was built for batch reporting. If you're still presenting AI value as hours-saved, you're losing the budget argument before it starts."},
-    {"rank":3,"title":"The Data Moat Is Dead - What Replaces It as Strategic Advantage","tension":"For a decade, proprietary data was the defensible edge. Foundation models have commoditized data advantage faster than most executives have internalized.","why_it_matters":"Executives investing in data hoarding instead of workflow integration are building walls around empty vaults.","common_mistake":"Leaders conflate data volume with data advantage, not recognizing scarcity has shifted from data to operational judgment.","sub_questions":["What does a defensible moat look like when foundation models approximate your proprietary knowledge?","How do you communicate the shift from data strategy to workflow strategy to a board that funded the data lake?","Where does first-party behavioral data still create genuine asymmetry?"],"trailer_hook":"The data moat argument used to work. You had the data, competitors didn't, you had the edge. That logic is collapsing. When foundation models synthesize industry knowledge from public sources that rivals your proprietary training data, the moat isn't the data. The moat is the workflow."},
-    {"rank":4,"title":"Beverage Alcohol's Data Silence Problem: Why the Industry Knows Less Than It Should","tension":"Despite massive distribution networks and decades of sell-through data, beverage alcohol remains one of the most information-asymmetric industries in CPG - by design.","why_it_matters":"The next competitive wave belongs to operators who solve the last-mile data problem, not those who spend more on brand.","common_mistake":"Brand teams treat the data gap as a vendor problem when the actual barrier is three-tier incentive misalignment no data provider can fix.","sub_questions":["What would real-time venue-level visibility require in a three-tier system?","Where does menu scraping create actionable intelligence that replaces missing sell-through data?","What's the strategic value of knowing venue penetration before competitors do?"],"trailer_hook":"The beverage alcohol industry sits on a paradox. Trillion-dollar brands. Global distribution. And almost no reliable real-time data on what's happening at venue level. The three-tier system was designed to create information asymmetry. That changes when AI reads menus at scale."},
-    {"rank":5,"title":"Why Your Best Analysts Are Training Their Own Replacements","tension":"High-performing analysts who adopt AI are simultaneously commoditizing their own skills and becoming the most irreplaceable people in the organization.","why_it_matters":"Analytics talent strategy needs a complete rethink as the skill premium shifts from technical execution to system design.","common_mistake":"Analytics leaders protect headcount by resisting AI adoption, creating conditions for their function to be outsourced once leadership runs the math on AI-enabled generalists.","sub_questions":["What's the right ratio of AI-augmented analysts to traditional FTEs?","What skills are you hiring for in 2026 that didn't exist as a category in 2022?","How do you restructure performance management when AI handles most measurable output?"],"trailer_hook":"Your best analyst just used Claude to do in 20 minutes what used to take two weeks. You've repriced their labor market value downward and upward simultaneously. The person who knows how to direct AI toward the right problem is extraordinarily rare. How you respond to that tension will determine whether your analytics function compounds or collapses."},
-    {"rank":6,"title":"The CAO Role Is Disappearing - What Comes Next Is More Powerful and Harder to Fill","tension":"The Chief Analytics Officer title is being absorbed into CAIO, CDO, and CTO roles - but the executive who translates AI capability into business strategy has never been more scarce.","why_it_matters":"Analytics leaders who define themselves by function rather than strategic value will find their seats eliminated in the next org redesign.","common_mistake":"CAOs defend their role by proving team output rather than positioning themselves as the interpreter between AI capability and board-level strategy.","sub_questions":["What's the actual job description of the executive who owns AI strategy in a post-CAO structure?","How do you transition from functional leader to strategic interpreter before the title disappears?","How do you build the board relationship that makes you essential regardless of title?"],"trailer_hook":"The CAO title is getting squeezed from three directions - Chief AI Officers taking the forward mandate, CDOs absorbing governance, CTOs claiming infrastructure. If your value proposition is 'I run the analytics function,' that's a shrinking job. If it's 'I make AI investments legible to the board,' that role has never been more critical or more vacant."}
-]
+# Discover suggestions / morning prep. Filled with str.format_map, so literal
+# braces are doubled.
+SUGGESTIONS_PROMPT = """You are an editorial intelligence engine for a senior analytics/AI executive (CAO at Overproof, former VP Analytics at Diageo North America).
+
+Generate 10 high-signal topic ideas that are NEW and DISTINCT from everything already covered.
+
+ALREADY COVERED - DO NOT GENERATE ANYTHING SIMILAR TO THESE:
+{exclusion_block}
+
+SERIES ARCS IN PROGRESS:
+{series_block}
+
+BEHAVIORAL SIGNALS - USE THESE TO CALIBRATE RECOMMENDATIONS:
+Strong interest (listened 75%+ or completed): Generate topics that go DEEPER or adjacent to these.
+{strong_block}
+
+Moderate interest (previewed or partially listened): Good signal for adjacent angles.
+{moderate_block}
+
+Dismissed (explicitly not interested): AVOID topics in this territory.
+{dismissed_block}
+
+EXECUTIVE PROFILE:
+- Thinks in systems, incentives, capital allocation, and moats
+- Enterprise AI: governance, multi-agent systems, ROI measurement
+- Beverage alcohol: three-tier dynamics, venue intelligence, distributor data
+- Org design: CAO/CDO role evolution, analytics talent strategy
+- Active C-suite job seeker: CAO, CDO, VP Analytics
+
+RULES:
+- Every topic must be meaningfully distinct from the exclusion list
+- Weight toward strong_interest adjacencies - these are proven signals
+- Do NOT generate anything in the dismissed territory
+- Include 2-3 trending topics from the last 30 days
+- Contrarian angle required - challenges comfortable consensus
+- Zero generic AI hype topics
+
+{output_spec}"""
+
+# Nightly trailer topics; same placeholders as SUGGESTIONS_PROMPT
+NIGHTLY_TRAILER_PROMPT = """You are a high-precision editorial recommender for a senior analytics/AI executive (CAO at Overproof, former VP Analytics Diageo North America).
+
+Your task: Generate exactly 6 topic candidates for overnight trailer production.
+
+ALREADY COVERED - DO NOT GENERATE ANYTHING SIMILAR:
+{exclusion_block}
+
+SERIES ARCS IN PROGRESS:
+{series_block}
+
+BEHAVIORAL SIGNALS (actual listen data - weight these heavily):
+Strong interest - listened 75%+ or completed:
+{strong_block}
+
+Moderate interest - previewed or partial listen:
+{moderate_block}
+
+Dismissed - explicitly rejected. Stay away:
+{dismissed_block}
+
+EXECUTIVE PROFILE:
+- Ed Dobbles, CAO at Overproof (beverage alcohol AI/analytics)
+- Former VP Advanced Analytics, Diageo North America
+- Building multi-agent AI governance frameworks
+- Enterprise deals with Heineken, Beam Suntory, Diageo
+- Thinks in systems, incentives, moats, capital allocation
+
+CONSTRAINTS:
+- All 6 must clear a HIGH confidence bar
+- Topics near strong_interest adjacencies get priority
+- NEVER generate anything in the dismissed territory
+- Mix: 2-3 enterprise AI/governance, 1-2 beverage alcohol/CPG, 1-2 org/talent/career
+- At least 2 TIME-SENSITIVE topics (next 30 days)
+
+{output_spec}"""
+
+FALLBACK_TOPICS_FILE = Path(__file__).parent / "data" / "fallback_topics.json"
+_fallback_topics = None
+
+def get_fallback_topics():
+    global _fallback_topics
+    if _fallback_topics is None:
+        _fallback_topics = _jloads(FALLBACK_TOPICS_FILE)
+    return _fallback_topics
 
 AR_DASHBOARD_URL = "https://ar-intelligence-dashboard-production.up.railway.app/"
 
+# (marker, section key, max chars, keep marker text) in page order; the last
+# marker only bounds the section before it.
+_AR_SECTIONS = (
+    ("Executive Summary", "executive_summary", 800, False),
+    ("Dominant strategic positions", "positions", 1500, True),
+    ("Strategic contradictions", "tensions", 1000, True),
+    ("Questions that demonstrate", None, 0, True),
+)
+
+@functools.lru_cache(maxsize=4)
+def _parse_ar_sections(html):
+    from selectolax.lexbor import LexborHTMLParser
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(["script", "style"])
+    raw = tree.body.text(separator="\n", strip=True) if tree.body else ""
+
+    found = []
+    pos = 0
+    for spec in _AR_SECTIONS:
+        i = raw.find(spec[0], pos)
+        if i >= 0:
+            found.append((i, spec))
+            pos = i + len(spec[0])
+
+    sections = {}
+    for n, (start, (marker, key, limit, keep_marker)) in enumerate(found):
+        if not key: continue
+        end = found[n + 1][0] if n + 1 < len(found) else len(raw)
+        if not keep_marker:
+            start += len(marker)
+        sections[key] = raw[start:end].strip()[:limit]
+    return sections
+
+_AR_TTL = 600
+# "text" and "prompt_suffix" are the sections pre-rendered for prompts, built
+# once per refresh.
+_ar_cache = {"ts": 0.0, "data": None, "text": "", "prompt_suffix": ""}
+
 def fetch_ar_intelligence():
+    if _ar_cache["data"] is not None and time.time() - _ar_cache["ts"] < _AR_TTL:
+        return _ar_cache["data"]
     try:
-        import urllib.request
-        from html.parser import HTMLParser
-        req = urllib.request.Request(AR_DASHBOARD_URL,
+        resp = _HTTP.get(AR_DASHBOARD_URL, timeout=15,
             headers={"User-Agent": "Mozilla/5.0 (compatible; IntelligenceBriefings/1.0)"})
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            html = resp.read().decode("utf-8", errors="replace")
-        class TextExtractor(HTMLParser):
-            def __init__(self):
-                super().__init__()
-                self.text_parts = []
-                self.skip_tags = {"script", "style", "head"}
-                self._skip = 0
-            def handle_starttag(self, tag, attrs):
-                if tag in self.skip_tags: self._skip += 1
-            def handle_endtag(self, tag):
-                if tag in self.skip_tags and self._skip > 0: self._skip -= 1
-            def handle_data(self, data):
-                if self._skip == 0:
-                    s = data.strip()
-                    if s: self.text_parts.append(s)
-        parser = TextExtractor()
-        parser.feed(html)
-        raw = "\n".join(parser.text_parts)
-        sections = {}
-        if "Executive Summary" in raw:
-            s = raw.find("Executive Summary") + len("Executive Summary")
-            e = raw.find("Dominant strategic positions", s)
-            sections["executive_summary"] = raw[s:e].strip()[:800]
-        if "Dominant strategic positions" in raw:
-            s = raw.find("Dominant strategic positions")
-            e = raw.find("Strategic contradictions", s)
-            sections["positions"] = raw[s:e].strip()[:1500]
-        if "Strategic contradictions" in raw:
-            s = raw.find("Strategic contradictions")
-            e = raw.find("Questions that demonstrate", s)
-            sections["tensions"] = raw[s:e].strip()[:1000]
+        resp.raise_for_status()
+        html = resp.content.decode("utf-8", errors="replace")
+        sections = _parse_ar_sections(html)
+        if sections:
+            text = "\n\n".join(f"{k.upper()}:\n{v}" for k, v in sections.items())
+            _ar_cache.update(ts=time.time(), data=sections, text=text,
+                             prompt_suffix="\n\nLIVE COMPETITIVE INTELLIGENCE (AnswerRocket):\n" + text)
         return sections
     except Exception as e:
         print(f"AR fetch failed: {e}")
@@ -325,8 +685,12 @@ def fetch_ar_intelligence():
 SCRIPT_MODEL = "claude-opus-4-20250514"      # premium: scripts, series outlines
 EDITORIAL_MODEL = "claude-sonnet-4-20250514"  # cost-effective: topics, chat-to-topic, suggestions
 
-def call_anthropic(messages, max_tokens=2500, use_web_search=False, model=None):
-    import urllib.request
+# Set to fall back to parsing JSON out of the reply text instead of tool calls
+LEGACY_JSON_PARSING = bool(os.environ.get("LEGACY_JSON_PARSING"))
+
+def call_anthropic(messages, max_tokens=2500, use_web_search=False, model=None, tools=None, timeout=None):
+    """tools: client tool definitions for structured output. Without web search the
+    first one is forced; with web search the model picks, since it must search first."""
     resolved_model = model or EDITORIAL_MODEL
     body = {
         "model": resolved_model,
@@ -335,7 +699,11 @@ def call_anthropic(messages, max_tokens=2500, use_web_search=False, model=None):
     }
     if use_web_search:
         body["tools"] = [{"type": "web_search_20250305", "name": "web_search"}]
-    payload = json.dumps(body).encode()
+    if tools:
+        body["tools"] = body.get("tools", []) + tools
+        if not use_web_search:
+            body["tool_choice"] = {"type": "tool", "name": tools[0]["name"]}
+    payload = orjson.dumps(body)
     headers = {
         "x-api-key": ANTHROPIC_API_KEY,
         "anthropic-version": "2023-06-01",
@@ -343,15 +711,13 @@ def call_anthropic(messages, max_tokens=2500, use_web_search=False, model=None):
     }
     if use_web_search:
         headers["anthropic-beta"] = "web-search-2025-03-05"
-    req = urllib.request.Request(
-        "https://api.anthropic.com/v1/messages",
-        data=payload,
-        headers=headers
-    )
-    timeout = 300 if use_web_search else 90
+    if timeout is None:
+        timeout = 300 if use_web_search else 90
     t0 = time.time()
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        data = json.loads(resp.read())
+    resp = _HTTP.post("https://api.anthropic.com/v1/messages",
+                      data=payload, headers=headers, timeout=timeout)
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
     latency_ms = round((time.time() - t0) * 1000)
     # --- cost tracking ---
     usage = data.get("usage", {})
@@ -361,44 +727,109 @@ def call_anthropic(messages, max_tokens=2500, use_web_search=False, model=None):
     _log_api_cost("anthropic", resolved_model, in_tok, out_tok, cost, latency_ms, "content-intelligence")
     return data
 
+# Editorial web-search calls (suggestions, nightly topics) should not hold a worker for 5 minutes
+EDITORIAL_SEARCH_TIMEOUT = 120
+
+def call_anthropic_searching(messages, label, **kwargs):
+    """Web-search call with a no-search fallback when the request itself fails
+    (timeout, connection error, any HTTP error status). A search call that
+    succeeds is returned as-is, so an unusable reply is never paid for twice."""
+    try:
+        return call_anthropic(messages, use_web_search=True, **kwargs)
+    except requests.RequestException as e:
+        print(f"[{label}] Web search failed ({type(e).__name__}: {e}), retrying without search")
+        return call_anthropic(messages, use_web_search=False, **kwargs)
+
 def extract_text(data):
     return " ".join(b["text"] for b in data.get("content", []) if b.get("type") == "text").strip()
 
+def tool_input(data, name):
+    """Input dict of the first call to client tool `name`, or None if it wasn't called."""
+    for b in data.get("content", []):
+        if b.get("type") == "tool_use" and b.get("name") == name:
+            return b["input"]
+    return None
+
+def forced_tool_input(messages, data, tool, label, **kwargs):
+    """Input of client tool `tool` from a reply. With web search on the tool can't be
+    forced, so a turn that ends in prose or pause_turn gets one follow-up call,
+    without search, that forces the tool on the text gathered so far."""
+    emitted = tool_input(data, tool["name"])
+    if emitted is not None:
+        return emitted
+    print(f"[{label}] Reply had no {tool['name']} call (stop_reason={data.get('stop_reason')}), forcing it")
+    followup = list(messages)
+    text = extract_text(data)
+    if text:
+        followup += [{"role": "assistant", "content": text},
+                     {"role": "user", "content": f"Now call the {tool['name']} tool with the complete result."}]
+    emitted = tool_input(call_anthropic(followup, tools=[tool], **kwargs), tool["name"])
+    if emitted is None:
+        raise ValueError(f"No {tool['name']} call in reply")
+    return emitted
+
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)(?:```|\Z)", re.DOTALL)
+
+def _unfence(text):
+    """Body of the first ``` / ```json fenced block, or the text itself if unfenced."""
+    m = _FENCE_RE.search(text)
+    return m.group(1).strip() if m else text.strip()
+
+_FENCED_ARRAY_RE = re.compile(r"```(?:json)?\s*(\[.*?\])\s*```", re.DOTALL)
+_BARE_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+def _extract_json_array(text):
+    """Parse the JSON array in a reply: the fenced one if there is one, otherwise the
+    outermost [...] span, ignoring any prose or trailer around it."""
+    m = _FENCED_ARRAY_RE.search(text)
+    if m:
+        return orjson.loads(m.group(1))
+    m = _BARE_ARRAY_RE.search(text)
+    if not m:
+        raise ValueError("No JSON array in response")
+    return orjson.loads(m.group(0))
+
 # ---------------------------------------------------------------------------
 # TOPIC GENERATION
 # ---------------------------------------------------------------------------
 
-def get_topics_for_today():
-    today = date.today().isoformat()
-    if TOPICS_CACHE.exists():
+_topics_cache_mem = {"mtime": None, "date": None, "topics": None}
+
+def _cached_topics(today):
+    """Today's topics from TOPICS_CACHE, or None. Memoized on the file's mtime so
+    both workers converge on whichever set was written last."""
+    try:
+        mtime = TOPICS_CACHE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if _topics_cache_mem["mtime"] != mtime:
         try:
-            cached = json.loads(TOPICS_CACHE.read_text())
-            if cached.get("date") == today:
-                return cached["topics"]
+            cached = _jloads(TOPICS_CACHE)
         except Exception:
-            pass
+            return None
+        _topics_cache_mem.update(mtime=mtime, date=cached.get("date"), topics=cached.get("topics"))
+    return _topics_cache_mem["topics"] if _topics_cache_mem["date"] == today else None
+
+def get_topics_for_today():
+    today = date.today().isoformat()
+    topics = _cached_topics(today)
+    if topics is not None:
+        return topics
     topics = generate_topics_via_claude()
-    TOPICS_CACHE.write_text(json.dumps({"date": today, "topics": topics}, indent=2))
+    _jdumps(TOPICS_CACHE, {"date": today, "topics": topics})
     return topics
 
 def generate_topics_via_claude():
     if not ANTHROPIC_API_KEY:
-        return FALLBACK_TOPICS
+        return get_fallback_topics()
     try:
         ar_data = fetch_ar_intelligence()
-        prompt = EDITORIAL_PROMPT
-        if ar_data:
-            parts = [f"{k.upper()}:\n{v}" for k, v in ar_data.items()]
-            prompt += "\n\nLIVE COMPETITIVE INTELLIGENCE (AnswerRocket):\n" + "\n\n".join(parts)
+        prompt = EDITORIAL_PROMPT + (_ar_cache["prompt_suffix"] if ar_data else "")
         data = call_anthropic([{"role": "user", "content": prompt}], max_tokens=2500)
-        text = extract_text(data).strip()
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"): text = text[4:]
-        return json.loads(text)[:6]
+        return _extract_json_array(extract_text(data))[:6]
     except Exception as e:
         print(f"Topic gen failed: {e}")
-        return FALLBACK_TOPICS
+        return get_fallback_topics()
 
 # ---------------------------------------------------------------------------
 # AUTO-QUEUE FROM ANSWERROCKET
@@ -411,7 +842,7 @@ def autoqueue_ar_topic(voice_alex, voice_morgan):
             print("[AUTOQUEUE] No AR data available")
             return None
 
-        ar_text = "\n\n".join(f"{k.upper()}:\n{v}" for k, v in ar_data.items())
+        ar_text = _ar_cache["text"]
         prompt = f"""You are an editorial producer. Based on this live competitive intelligence,
 generate the single most actionable topic for an executive analytics podcast.
 
@@ -430,20 +861,13 @@ Return a SINGLE topic as valid JSON (no markdown):
 }}"""
 
         data = call_anthropic([{"role": "user", "content": prompt}], max_tokens=1000)
-        text = extract_text(data).strip()
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"): text = text[4:]
+        text = _unfence(extract_text(data))
         topic = json.loads(text)
         topic["title"] = "[AR] " + topic["title"]
 
         job_id = create_job("generate")
-        threading.Thread(
-            target=_run_generate,
-            args=(job_id, topic, "standard", voice_alex, voice_morgan, False,
-                  topic.get("production_brief", "")),
-            daemon=True
-        ).start()
+        JOB_EXECUTOR.submit(_run_generate, job_id, topic, "standard", voice_alex, voice_morgan, False,
+                            topic.get("production_brief", ""))
         print(f"[AUTOQUEUE] Queued AR topic: {topic['title']} -> job {job_id}")
         return job_id
     except Exception as e:
@@ -454,13 +878,63 @@ Return a SINGLE topic as valid JSON (no markdown):
 # SERIES GENERATION
 # ---------------------------------------------------------------------------
 
+_series_cache = {"mtime": None, "data": [], "by_id": {}}
+
+def _set_series_cache(mtime, data):
+    _series_cache.update(mtime=mtime, data=data, by_id={s["id"]: s for s in data})
+
+def _cached_series():
+    try:
+        mtime = SERIES_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    if _series_cache["mtime"] != mtime:
+        try: data = _jloads_mapped(SERIES_FILE)
+        except: return None
+        _set_series_cache(mtime, data)
+    return _series_cache
+
 def load_series():
-    if not SERIES_FILE.exists(): return []
-    try: return json.loads(SERIES_FILE.read_text())
-    except: return []
+    """Series list, re-read only when series.json changes. Entries are copies,
+    so callers can edit and save_series them."""
+    cache = _cached_series()
+    return [dict(s) for s in cache["data"]] if cache else []
+
+def load_series_by_id(series_id):
+    cache = _cached_series()
+    s = cache["by_id"].get(series_id) if cache else None
+    return dict(s) if s else None
 
 def save_series(series_list):
-    SERIES_FILE.write_text(json.dumps(series_list, indent=2))
+    _jdumps(SERIES_FILE, series_list)
+    _set_series_cache(SERIES_FILE.stat().st_mtime_ns, [dict(s) for s in series_list])
+
+_series_lock = threading.Lock()  # serializes load/modify/save of series.json within the process
+
+def add_series(entry):
+    with _series_lock:
+        series_list = load_series()
+        series_list.append(entry)
+        save_series(series_list)
+
+def update_series(series_id, **fields):
+    """Set fields on one series entry and save; False if the series is gone."""
+    with _series_lock:
+        series_list = load_series()
+        s = next((x for x in series_list if x["id"] == series_id), None)
+        if not s:
+            return False
+        s.update(fields)
+        save_series(series_list)
+        return True
+
+def _count_series_episode(series_id):
+    with _series_lock:
+        series_list = load_series()
+        s = next((x for x in series_list if x["id"] == series_id), None)
+        if s:
+            s["completed"] = s.get("completed", 0) + 1
+            save_series(series_list)
 
 def generate_series_outline(topic_or_prompt, num_episodes=6):
     if isinstance(topic_or_prompt, dict):
@@ -495,80 +969,89 @@ Return ONLY a valid JSON array of {num_episodes} topic objects, no markdown:
 
     try:
         data = call_anthropic([{"role": "user", "content": prompt}], max_tokens=4000, model=SCRIPT_MODEL)
-        text = extract_text(data).strip()
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"): text = text[4:]
-        episodes = json.loads(text)
+        episodes = _extract_json_array(extract_text(data))
         print(f"[SERIES] Generated {len(episodes)}-episode arc (Opus)")
         return episodes
     except Exception as e:
         print(f"[SERIES] Outline generation failed: {e}")
         raise
 
-def _run_series(series_id, episodes, voice_alex, voice_morgan):
-    series_list = load_series()
-    series_entry = next((s for s in series_list if s["id"] == series_id), None)
-    if not series_entry:
-        return
+SERIES_SCRIPT_WORKERS = 2
+# Caps Opus script calls across all series runs; each run's script pool is the same size
+_script_slots = threading.Semaphore(SERIES_SCRIPT_WORKERS)
+
+def _series_script(job_id, ep_topic, ep_num, total):
+    with _script_slots:
+        update_job(job_id, status="running",
+                   progress=f"Episode {ep_num}/{total}: Writing script...")
+        production_brief = ep_topic.get("series_context", "")
+        if ep_num > 1:
+            production_brief += f" This is episode {ep_num} of {total} in the series - assume listeners heard previous episodes."
+        script, sources = generate_grounded_script(ep_topic, depth="standard",
+                                                    production_brief=production_brief)
+    log_production()
+    update_job(job_id, progress=f"Episode {ep_num}/{total}: Script ready, waiting for audio...")
+    return script, sources
 
-    for i, ep_topic in enumerate(episodes):
-        ep_num = i + 1
-        job_id = series_entry["job_ids"][i]
+SERIES_EPISODE_WORKERS = 2
 
-        try:
-            update_job(job_id, status="running",
-                       progress=f"Episode {ep_num}/{len(episodes)}: Writing script...")
+def _series_episode(series_id, series_title, job_id, ep_topic, ep_num, total,
+                    voice_alex, voice_morgan, script_future):
+    try:
+        script, sources = script_future.result()
 
-            production_brief = ep_topic.get("series_context", "")
-            if ep_num > 1:
-                production_brief += f" This is episode {ep_num} of {len(episodes)} in the series - assume listeners heard previous episodes."
+        update_job(job_id, status="running",
+                   progress=f"Episode {ep_num}/{total}: Generating audio ({len(script)} segments)...")
+        client = get_elevenlabs_client()
+        voice_a_id = resolve_voice(client, voice_alex)
+        voice_b_id = resolve_voice(client, voice_morgan)
+        if not voice_a_id or not voice_b_id:
+            update_job(job_id, status="error", error="Voice not found")
+            return
 
-            script, sources = generate_grounded_script(ep_topic, depth="standard",
-                                                        production_brief=production_brief)
-            log_production()
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        ep_id = f"series-{series_id}-ep{ep_num}-{timestamp}-{uuid.uuid4().hex[:6]}"
+        _, file_size = generate_episode_audio(client, script, ep_id, voice_a_id, voice_b_id)
 
-            update_job(job_id, progress=f"Episode {ep_num}/{len(episodes)}: Generating audio ({len(script)} segments)...")
-            client = get_elevenlabs_client()
-            voice_a_id = resolve_voice(client, voice_alex)
-            voice_b_id = resolve_voice(client, voice_morgan)
-            if not voice_a_id or not voice_b_id:
-                update_job(job_id, status="error", error="Voice not found")
-                continue
+        entry = {
+            "id": ep_id,
+            "title": f"[S: {series_title}] Ep {ep_num}: {ep_topic['title']}",
+            "description": ep_topic.get("tension", ""),
+            "file": f"{ep_id}.mp3",
+            "file_size": file_size,
+            "depth": "Standard",
+            "is_trailer": False,
+            "sources": sources,
+            "published": datetime.now(timezone.utc).isoformat(),
+            "series_id": series_id,
+            "series_ep": ep_num,
+        }
+        save_episode(entry)
+        update_job(job_id, status="done", progress=f"Episode {ep_num} complete",
+                   result={"episode": entry, "sources": sources})
 
-            timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-            ep_id = f"series-{series_id}-ep{ep_num}-{timestamp}"
-            ep_dir = EPISODES_DIR / ep_id
-            final_path = generate_episode_audio(client, script, ep_dir, voice_a_id, voice_b_id)
-            dest = EPISODES_DIR / f"{ep_id}.mp3"
-            shutil.copy2(final_path, dest)
-
-            entry = {
-                "id": ep_id,
-                "title": f"[S: {series_entry['title']}] Ep {ep_num}: {ep_topic['title']}",
-                "description": ep_topic.get("tension", ""),
-                "file": f"{ep_id}.mp3",
-                "file_size": dest.stat().st_size,
-                "depth": "Standard",
-                "is_trailer": False,
-                "sources": sources,
-                "published": datetime.now(timezone.utc).isoformat(),
-                "series_id": series_id,
-                "series_ep": ep_num,
-            }
-            save_episode(entry)
-            update_job(job_id, status="done", progress=f"Episode {ep_num} complete",
-                       result={"episode": entry, "sources": sources})
+        _count_series_episode(series_id)
 
-            series_list = load_series()
-            s = next((x for x in series_list if x["id"] == series_id), None)
-            if s:
-                s["completed"] = s.get("completed", 0) + 1
-                save_series(series_list)
+    except Exception as e:
+        import traceback; traceback.print_exc()
+        update_job(job_id, status="error", error=str(e))
 
-        except Exception as e:
-            import traceback; traceback.print_exc()
-            update_job(job_id, status="error", error=str(e))
+def _run_series(series_id, episodes, voice_alex, voice_morgan):
+    series_list = load_series()
+    series_entry = next((s for s in series_list if s["id"] == series_id), None)
+    if not series_entry:
+        return
+
+    # Scripts depend only on the outline, so they are all written ahead; up to
+    # SERIES_EPISODE_WORKERS episodes record audio at once as their scripts land.
+    total = len(episodes)
+    with ThreadPoolExecutor(max_workers=SERIES_SCRIPT_WORKERS) as script_pool, \
+            ThreadPoolExecutor(max_workers=SERIES_EPISODE_WORKERS) as episode_pool:
+        for i, ep_topic in enumerate(episodes):
+            job_id = series_entry["job_ids"][i]
+            script_future = script_pool.submit(_series_script, job_id, ep_topic, i + 1, total)
+            episode_pool.submit(_series_episode, series_id, series_entry["title"], job_id,
+                                ep_topic, i + 1, total, voice_alex, voice_morgan, script_future)
 
 # ---------------------------------------------------------------------------
 # CHAT
@@ -601,16 +1084,45 @@ Tone: sharp, executive, zero fluff."""
         "content": system + "\n\n" + context + user_message
     }], max_tokens=1000)
 
-    text = extract_text(data).strip()
-    if text.startswith("```"):
-        text = text.split("```")[1]
-        if text.startswith("json"): text = text[4:]
+    text = _unfence(extract_text(data))
     return json.loads(text)
 
 # ---------------------------------------------------------------------------
 # SCRIPT GENERATION
 # ---------------------------------------------------------------------------
 
+SCRIPT_TOOL = {
+    "name": "emit_script",
+    "description": "Return the finished podcast script and the sources it draws on.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "segments": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "host": {"type": "string", "enum": ["Alex", "Morgan"]},
+                        "text": {"type": "string"},
+                    },
+                    "required": ["host", "text"],
+                },
+            },
+            "sources": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["segments", "sources"],
+    },
+}
+
+_SCRIPT_OUTPUT = """When the script is complete, call the emit_script tool with every segment in order
+(host is "Alex" or "Morgan") and the list of sources you drew on."""
+
+_SCRIPT_OUTPUT_LEGACY = """Return ONLY a valid JSON array, no markdown, no preamble:
+[{"host": "Alex", "text": "..."}, {"host": "Morgan", "text": "..."}, ...]
+
+After the JSON array, on a new line:
+SOURCES: source1, source2, source3"""
+
 def generate_grounded_script(topic, depth="standard", production_brief=""):
     brief_section = f"\nPRODUCTION BRIEF:\n{production_brief}\n" if production_brief else ""
 
@@ -665,35 +1177,30 @@ STRUCTURE (each section gets {max(2, seg_min//6)}-{max(3, seg_min//4)} segments)
 MINIMUM: {seg_min} segments total. Count before returning. Add more if under.
 Each segment: 3-5 substantial spoken sentences. No one-liners.
 
-Return ONLY a valid JSON array, no markdown, no preamble:
-[{{"host": "Alex", "text": "..."}}, {{"host": "Morgan", "text": "..."}}, ...]
-
-After the JSON array, on a new line:
-SOURCES: source1, source2, source3"""
+{_SCRIPT_OUTPUT_LEGACY if LEGACY_JSON_PARSING else _SCRIPT_OUTPUT}"""
 
+    tools = None if LEGACY_JSON_PARSING else [SCRIPT_TOOL]
+    messages = [{"role": "user", "content": prompt}]
     try:
         try:
-            data = call_anthropic([{"role": "user", "content": prompt}],
-                                  max_tokens=4000, use_web_search=True, model=SCRIPT_MODEL)
+            data = call_anthropic(messages, max_tokens=4000, use_web_search=True, model=SCRIPT_MODEL, tools=tools)
             print("[SCRIPT] Web search enabled, using Opus")
         except Exception as ws_err:
             print(f"[SCRIPT] Web search failed ({ws_err}), falling back to no-search")
-            data = call_anthropic([{"role": "user", "content": prompt}],
-                                  max_tokens=4000, use_web_search=False, model=SCRIPT_MODEL)
-        full_text = extract_text(data)
-
-        sources = []
-        script_text = full_text
-        if "SOURCES:" in full_text:
-            parts = full_text.rsplit("SOURCES:", 1)
-            script_text = parts[0].strip()
-            sources = [s.strip() for s in parts[1].strip().split(",") if s.strip()]
-
-        if "```" in script_text:
-            script_text = script_text.split("```")[1]
-            if script_text.startswith("json"): script_text = script_text[4:]
-
-        script = json.loads(script_text.strip())
+            data = call_anthropic(messages, max_tokens=4000, use_web_search=False, model=SCRIPT_MODEL, tools=tools)
+
+        if tools:
+            emitted = forced_tool_input(messages, data, SCRIPT_TOOL, "SCRIPT", max_tokens=4000, model=SCRIPT_MODEL)
+            script, sources = emitted["segments"], emitted.get("sources", [])
+        else:
+            full_text = extract_text(data)
+            sources = []
+            script_text = full_text
+            if "SOURCES:" in full_text:
+                parts = full_text.rsplit("SOURCES:", 1)
+                script_text = parts[0].strip()
+                sources = [s.strip() for s in parts[1].strip().split(",") if s.strip()]
+            script = _extract_json_array(script_text)
         print(f"[SCRIPT OK] {len(script)} segments generated")
         return script, sources
     except Exception as e:
@@ -727,44 +1234,241 @@ def build_trailer_script(topic):
         {"host": "Alex", "text": f"For the full briefing on {topic['title']}, hit Generate Briefing. I'm Alex."}
     ], []
 
+# ---------------------------------------------------------------------------
+# EDITORIAL CONTEXT - exclusions and engagement signals shared by suggestions,
+# morning prep and the nightly trailer job
+# ---------------------------------------------------------------------------
+
+EDITORIAL_RECENT_TITLES = 30
+_editorial_context_mem = {"hash": None}
+
+def _editorial_sources_hash(today):
+    key = [today]
+    for p in (TOPICS_CACHE, EPISODES_LOG, SERIES_FILE, ENGAGEMENT_LOG):
+        try:
+            key.append(p.stat().st_mtime_ns)
+        except FileNotFoundError:
+            key.append(0)
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+def build_editorial_context(today):
+    """Raw inputs for the editorial prompts, rebuilt only when one of the source
+    files changes. Persisted so the other worker and later cron runs reuse it."""
+    global _editorial_context_mem
+    h = _editorial_sources_hash(today)
+    if _editorial_context_mem["hash"] == h:
+        return _editorial_context_mem
+    try:
+        ctx = _jloads(EDITORIAL_CONTEXT_FILE)
+        if ctx.get("hash") == h:
+            _editorial_context_mem = ctx
+            return ctx
+    except Exception:
+        pass
+
+    # Reuse the topics get_topics_for_today already parsed (morning prep warms it first)
+    today_topics = [t["title"] for t in _cached_topics(today) or []]
+    eng = get_engagement_summary()
+    ctx = {
+        "hash": h,
+        "today_topics": today_topics,
+        # newest first, so callers can take as many as their prompt wants
+        "commissioned": recent_episode_titles(EDITORIAL_RECENT_TITLES),
+        "series_titles": [s["title"] for s in load_series()],
+        "strong_interest": eng.get("strong_interest", []),
+        "moderate_interest": eng.get("moderate_interest", []),
+        "dismissed": eng.get("dismissed", []),
+    }
+    try:
+        _jdumps(EDITORIAL_CONTEXT_FILE, ctx)
+    except Exception as e:
+        print(f"[EDITORIAL] Could not persist context: {e}")
+    _editorial_context_mem = ctx
+    return ctx
+
+def _bullets(titles):
+    return "\n".join(f"- {t}" for t in titles) or "None yet."
+
+def editorial_blocks(ctx, recent):
+    """(exclusion, series, strong, moderate, dismissed) prompt blocks, excluding
+    today's topics plus the `recent` latest commissioned titles."""
+    all_exclusions = set(ctx["today_topics"])
+    all_exclusions.update(islice(ctx["commissioned"], recent))
+    # Sorted so the same inputs always render the same prompt text
+    return (_bullets(sorted(all_exclusions)), _bullets(ctx["series_titles"]),
+            _bullets(ctx["strong_interest"]), _bullets(ctx["moderate_interest"]),
+            _bullets(ctx["dismissed"]))
+
+# ---------------------------------------------------------------------------
+# DISCOVER SUGGESTIONS
+# ---------------------------------------------------------------------------
+
+_SUGGESTION_FIELDS = {
+    "rank": {"type": "integer"},
+    "title": {"type": "string", "description": "provocative but professional title"},
+    "tension": {"type": "string", "description": "core contrarian thesis in 1-2 sentences"},
+    "why_it_matters": {"type": "string", "description": "strategic importance for this specific executive in 1 sentence"},
+    "freshness": {"type": "string", "enum": ["evergreen", "trending", "time-sensitive"]},
+    "confidence_rationale": {"type": "string", "description": "1 sentence: why this maps to your demonstrated interests"},
+}
+
+SUGGESTIONS_TOOL = {
+    "name": "emit_suggestions",
+    "description": "Return the ranked topic suggestions.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "suggestions": {
+                "type": "array",
+                "items": {"type": "object", "properties": _SUGGESTION_FIELDS,
+                          "required": list(_SUGGESTION_FIELDS)},
+            },
+        },
+        "required": ["suggestions"],
+    },
+}
+
+_SUGGESTIONS_OUTPUT = "Call the emit_suggestions tool with exactly 10 suggestions, ranked 1-10."
+
+_SUGGESTIONS_OUTPUT_LEGACY = """Return ONLY a valid JSON array of exactly 10 objects, no markdown, no preamble:
+[{
+  "rank": 1,
+  "title": "provocative but professional title",
+  "tension": "core contrarian thesis in 1-2 sentences",
+  "why_it_matters": "strategic importance for this specific executive in 1 sentence",
+  "freshness": "evergreen | trending | time-sensitive",
+  "confidence_rationale": "1 sentence: why this maps to your demonstrated interests"
+}]"""
+
+_TRAILER_TOPIC_FIELDS = {
+    "rank": {"type": "integer"},
+    "title": {"type": "string", "description": "provocative but professional title"},
+    "tension": {"type": "string", "description": "core contrarian thesis in 1-2 sentences"},
+    "why_it_matters": {"type": "string", "description": "strategic importance in 1 sentence"},
+    "common_mistake": {"type": "string", "description": "what sophisticated leaders get wrong"},
+    "sub_questions": {"type": "array", "items": {"type": "string"}},
+    "trailer_hook": {"type": "string", "description": "3-4 sentence spoken-word hook, direct to a peer executive"},
+    "confidence_score": {"type": "integer", "minimum": 0, "maximum": 100},
+    "confidence_rationale": {"type": "string", "description": "1-2 sentences: specific reason this is high-confidence"},
+}
+
+TRAILER_TOPICS_TOOL = {
+    "name": "emit_topics",
+    "description": "Return the trailer topic candidates.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "topics": {
+                "type": "array",
+                "items": {"type": "object", "properties": _TRAILER_TOPIC_FIELDS,
+                          "required": list(_TRAILER_TOPIC_FIELDS)},
+            },
+        },
+        "required": ["topics"],
+    },
+}
+
+_TRAILER_TOPICS_OUTPUT = "Call the emit_topics tool with exactly 6 topics, ranked 1-6."
+
+_TRAILER_TOPICS_OUTPUT_LEGACY = """Return ONLY a valid JSON array of exactly 6 objects, no markdown:
+[{
+  "rank": 1,
+  "title": "provocative but professional title",
+  "tension": "core contrarian thesis in 1-2 sentences",
+  "why_it_matters": "strategic importance in 1 sentence",
+  "common_mistake": "what sophisticated leaders get wrong",
+  "sub_questions": ["question 1", "question 2", "question 3"],
+  "trailer_hook": "3-4 sentence spoken-word hook, direct to a peer executive",
+  "confidence_score": 85,
+  "confidence_rationale": "1-2 sentences: specific reason this is high-confidence"
+}]"""
+
+def generate_suggestions(today):
+    """Generate 10 Discover suggestions and write them to SUGGESTIONS_CACHE."""
+    exclusion_block, series_block, strong_block, moderate_block, dismissed_block = \
+        editorial_blocks(build_editorial_context(today), recent=30)
+
+    prompt = SUGGESTIONS_PROMPT.format_map({
+        "exclusion_block": exclusion_block, "series_block": series_block,
+        "strong_block": strong_block, "moderate_block": moderate_block,
+        "dismissed_block": dismissed_block,
+        "output_spec": _SUGGESTIONS_OUTPUT_LEGACY if LEGACY_JSON_PARSING else _SUGGESTIONS_OUTPUT,
+    })
+
+    tools = None if LEGACY_JSON_PARSING else [SUGGESTIONS_TOOL]
+    messages = [{"role": "user", "content": prompt}]
+    data = call_anthropic_searching(messages, "SUGGESTIONS",
+                                    max_tokens=3000, tools=tools, timeout=EDITORIAL_SEARCH_TIMEOUT)
+
+    if tools:
+        suggestions = forced_tool_input(messages, data, SUGGESTIONS_TOOL, "SUGGESTIONS",
+                                        max_tokens=3000)["suggestions"][:10]
+    else:
+        suggestions = _extract_json_array(extract_text(data))[:10]
+    _jdumps(SUGGESTIONS_CACHE, {"date": today, "suggestions": suggestions})
+    return suggestions
+
 # ---------------------------------------------------------------------------
 # RSS FEED
 # ---------------------------------------------------------------------------
 
-def build_feed():
-    eps = load_episodes()
-    feed_eps = sorted(
-        [e for e in eps if not e.get("is_trailer")],
-        key=lambda e: e.get("published", ""),
-        reverse=True
-    )
+_XML_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
 
-    def esc(s):
-        return (str(s).replace("&", "&amp;").replace("<", "&lt;")
-                .replace(">", "&gt;").replace('"', "&quot;"))
+def esc(s):
+    return str(s).translate(_XML_TABLE)
 
-    items = []
-    for ep in feed_eps:
-        audio_url = f"{BASE_URL}/episodes/{esc(ep['file'])}"
-        file_size = ep.get("file_size", 0)
-        try:
-            dt = datetime.fromisoformat(ep.get("published", ""))
-            pub_rfc = dt.strftime("%a, %d %b %Y %H:%M:%S +0000")
-        except Exception:
-            pub_rfc = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
+def _feed_etag(eps):
+    key = sorted((e.get("id", ""), e.get("file_size", 0)) for e in eps if not e.get("is_trailer"))
+    return hashlib.blake2b(repr((BASE_URL, key)).encode(), digest_size=16).hexdigest()
+
+def get_feed_etag():
+    try:
+        return FEED_ETAG_FILE.read_text().strip() or None
+    except FileNotFoundError:
+        return None
+
+_feed_lock = threading.Lock()
 
-        items.append(f"""    <item>
-      <title>{esc(ep.get('title', 'Intelligence Briefing'))}</title>
-      <description>{esc(ep.get('description', ''))}</description>
-      <enclosure url="{audio_url}" length="{file_size}" type="audio/mpeg"/>
-      <guid isPermaLink="false">{esc(ep.get('id', audio_url))}</guid>
-      <pubDate>{pub_rfc}</pubDate>
-      <itunes:title>{esc(ep.get('title', 'Intelligence Briefing'))}</itunes:title>
-      <itunes:summary>{esc(ep.get('description', ''))}</itunes:summary>
-      <itunes:explicit>no</itunes:explicit>
-    </item>""")
+def build_feed(force=False):
+    """Regenerate feed.xml from the current episode store, skipping the write when
+    the episode set is unchanged. Serialized so a build from an older episode list
+    can never land after a newer one."""
+    with _feed_lock:
+        eps = load_episodes()
+        etag = _feed_etag(eps)
+        if not force and FEED_FILE.exists() and get_feed_etag() == etag:
+            return
+        _write_feed(eps, etag)
+
+# (episodes.jsonl stat, feed.etag mtime) at the last check that found the feed current
+_feed_verified = {"key": None}
+
+def feed_is_current():
+    """Whether feed.xml matches the episode store; catches a build lost to another
+    worker. Only hashes when episodes.jsonl or feed.etag changed since the last check."""
+    try:
+        etag_mtime = FEED_ETAG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+    with _episodes_lock:
+        eps = _load_episodes_locked()
+        key = (_episodes_cache["stat"], etag_mtime)
+        if key[0] is not None and key == _feed_verified["key"]:
+            return True
+        current = FEED_FILE.exists() and get_feed_etag() == _feed_etag(eps)
+    if current:
+        _feed_verified["key"] = key
+    return current
+
+def _write_feed(eps, etag):
+    feed_eps = sorted(
+        [e for e in eps if not e.get("is_trailer")],
+        key=lambda e: e.get("published", ""),
+        reverse=True
+    )
 
-    feed_xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+    now_rfc = datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")
+    parts = [f"""<?xml version="1.0" encoding="UTF-8"?>
 <rss version="2.0"
   xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"
   xmlns:content="http://purl.org/rss/1.0/modules/content/">
@@ -778,74 +1482,236 @@ def build_feed():
     <itunes:category text="Business"/>
     <itunes:explicit>no</itunes:explicit>
     <itunes:type>episodic</itunes:type>
-    <lastBuildDate>{datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S +0000")}</lastBuildDate>
-{chr(10).join(items)}
-  </channel>
-</rss>"""
+    <lastBuildDate>{now_rfc}</lastBuildDate>
+"""]
+    for ep in feed_eps:
+        audio_url = f"{BASE_URL}/episodes/{esc(ep['file'])}"
+        file_size = ep.get("file_size", 0)
+        try:
+            dt = datetime.fromisoformat(ep.get("published", ""))
+            pub_rfc = dt.strftime("%a, %d %b %Y %H:%M:%S +0000")
+        except Exception:
+            pub_rfc = now_rfc
+        title = esc(ep.get('title', 'Intelligence Briefing'))
+        desc = esc(ep.get('description', ''))
+
+        parts.append(f"""    <item>
+      <title>{title}</title>
+      <description>{desc}</description>
+      <enclosure url="{audio_url}" length="{file_size}" type="audio/mpeg"/>
+      <guid isPermaLink="false">{esc(ep.get('id', audio_url))}</guid>
+      <pubDate>{pub_rfc}</pubDate>
+      <itunes:title>{title}</itunes:title>
+      <itunes:summary>{desc}</itunes:summary>
+      <itunes:explicit>no</itunes:explicit>
+    </item>
+""")
+    parts.append("  </channel>\n</rss>")
 
-    FEED_FILE.write_text(feed_xml, encoding="utf-8")
+    _atomic_write_bytes(FEED_FILE, "".join(parts).encode("utf-8"))
+    _atomic_write_bytes(FEED_ETAG_FILE, etag.encode())
     print(f"[FEED] Rebuilt: {len(feed_eps)} episodes")
 
 # ---------------------------------------------------------------------------
 # AUDIO
 # ---------------------------------------------------------------------------
 
+_eleven_client = None
+_eleven_lock = threading.Lock()
+
 def get_elevenlabs_client():
-    from elevenlabs import ElevenLabs
-    return ElevenLabs(api_key=ELEVEN_API_KEY)
+    """Process-wide ElevenLabs client over one keep-alive httpx pool, so parallel
+    TTS requests and later jobs reuse connections instead of re-handshaking."""
+    global _eleven_client
+    with _eleven_lock:
+        if _eleven_client is None:
+            import httpx
+            from elevenlabs import ElevenLabs
+            http = httpx.Client(
+                timeout=240,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20))
+            _eleven_client = ElevenLabs(api_key=ELEVEN_API_KEY, httpx_client=http)
+        return _eleven_client
+
+_VOICE_TTL = 900
+_voice_cache = {"ts": 0.0, "voices": None}
+_voice_lock = threading.Lock()
+
+def get_voice_list(client, refresh=False):
+    """ElevenLabs voice library as name/voice_id/category dicts, cached for _VOICE_TTL."""
+    with _voice_lock:
+        if not refresh and _voice_cache["voices"] is not None and time.time() - _voice_cache["ts"] < _VOICE_TTL:
+            return _voice_cache["voices"]
+        resp = client.voices.get_all()
+        voices = [{"name": v.name, "voice_id": v.voice_id, "category": v.category or "custom"}
+                  for v in resp.voices]
+        _voice_cache.update(ts=time.time(), voices=voices)
+        return voices
 
 def resolve_voice(client, name_or_id):
-    resp = client.voices.get_all()
-    for v in resp.voices:
-        if v.name.lower() == name_or_id.lower() or v.voice_id == name_or_id:
-            return v.voice_id
-    for v in resp.voices:
-        if name_or_id.lower() in v.name.lower():
-            return v.voice_id
+    voices = get_voice_list(client)
+    needle = name_or_id.lower()
+    for v in voices:
+        if v["name"].lower() == needle or v["voice_id"] == name_or_id:
+            return v["voice_id"]
+    for v in voices:
+        if needle in v["name"].lower():
+            return v["voice_id"]
     return None
 
-def generate_audio_bytes(client, text, voice_id):
-    return b"".join(client.text_to_speech.convert(
-        voice_id=voice_id, text=text,
-        model_id="eleven_turbo_v2_5", output_format="mp3_44100_128"))
-
-def generate_episode_audio(client, script, ep_dir, voice_a_id, voice_b_id):
-    ep_dir = Path(ep_dir)
-    ep_dir.mkdir(parents=True, exist_ok=True)
-    parts = []
-    for i, seg in enumerate(script):
-        vid = voice_a_id if seg["host"].lower() == "alex" else voice_b_id
-        p = ep_dir / f"seg_{i:02d}.mp3"
-        p.write_bytes(generate_audio_bytes(client, seg["text"], vid))
-        parts.append(p)
-    final = ep_dir / "episode.mp3"
-    with open(final, "wb") as out:
-        for f in parts:
-            out.write(f.read_bytes())
-    return final
+# Parallel ElevenLabs requests per episode; keep within the account tier's concurrency limit
+TTS_CONCURRENCY = int(os.environ.get("ELEVENLABS_CONCURRENCY", "6"))
+_TTS_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+# Caps in-flight TTS requests across every job in this process (single, chat, series)
+_tts_slots = threading.BoundedSemaphore(TTS_CONCURRENCY)
+
+def generate_audio_bytes(client, text, voice_id, retries=3):
+    for attempt in range(retries + 1):
+        try:
+            with _tts_slots:
+                return b"".join(client.text_to_speech.convert(
+                    voice_id=voice_id, text=text,
+                    model_id="eleven_turbo_v2_5", output_format="mp3_44100_128"))
+        except Exception as e:
+            if attempt == retries or getattr(e, "status_code", None) not in _TTS_RETRY_STATUS:
+                raise
+            delay = 2 ** attempt
+            print(f"[TTS] {getattr(e, 'status_code', '')} from ElevenLabs, retrying in {delay}s")
+            time.sleep(delay)
+
+# Debug aid: also keep each rendered segment as EPISODES_DIR/<ep_id>/seg_XX.mp3
+KEEP_SEGMENTS = bool(os.environ.get("KEEP_SEGMENTS"))
+
+def generate_episode_audio(client, script, ep_id, voice_a_id, voice_b_id):
+    """Render all segments and write the joined MP3 to EPISODES_DIR/<ep_id>.mp3.
+    Returns (path, size in bytes)."""
+    with ThreadPoolExecutor(max_workers=TTS_CONCURRENCY) as pool:
+        futures = [
+            pool.submit(generate_audio_bytes, client, seg["text"],
+                        voice_a_id if seg["host"].lower() == "alex" else voice_b_id)
+            for seg in script
+        ]
+        try:
+            parts = [fut.result() for fut in futures]
+        except Exception:
+            for fut in futures:
+                fut.cancel()
+            raise
+    if KEEP_SEGMENTS:
+        ep_dir = EPISODES_DIR / ep_id
+        ep_dir.mkdir(parents=True, exist_ok=True)
+        for i, data in enumerate(parts):
+            (ep_dir / f"seg_{i:02d}.mp3").write_bytes(data)
+    dest = EPISODES_DIR / f"{ep_id}.mp3"
+    with open(dest, "wb") as out:
+        out.writelines(parts)
+    return dest, sum(map(len, parts))
 
 # ---------------------------------------------------------------------------
 # EPISODES
 # ---------------------------------------------------------------------------
 
+# Parsed episodes.jsonl, keyed on (mtime_ns, size) so appends from the other
+# gunicorn worker are picked up.
+_episodes_cache = {"stat": None, "data": []}
+_episodes_lock = threading.Lock()
+
+def _migrate_legacy_episodes():
+    """One-time conversion of the old JSON-array episode list to JSONL."""
+    if EPISODES_LOG.exists() or not LEGACY_EPISODES_JSON.exists():
+        return
+    try:
+        eps = _jloads(LEGACY_EPISODES_JSON)
+        _atomic_write_bytes(EPISODES_LOG, b"".join(orjson.dumps(e) + b"\n" for e in eps))
+        print(f"[EPISODES] Migrated {len(eps)} episodes to {EPISODES_LOG.name}")
+    except Exception as e:
+        print(f"[EPISODES] Legacy list migration failed: {e}")
+
+def _load_episodes_locked():
+    try:
+        st = EPISODES_LOG.stat()
+    except FileNotFoundError:
+        _episodes_cache.update(stat=None, data=[])
+        return _episodes_cache["data"]
+    key = (st.st_mtime_ns, st.st_size)
+    if _episodes_cache["stat"] != key:
+        eps = []
+        with open(EPISODES_LOG, "rb") as f:
+            for line in f:
+                try:
+                    eps.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    continue
+        _episodes_cache.update(stat=key, data=eps)
+    return _episodes_cache["data"]
+
 def load_episodes():
-    if not EPISODES_JSON.exists(): return []
-    try: return json.loads(EPISODES_JSON.read_text())
-    except: return []
+    with _episodes_lock:
+        return list(_load_episodes_locked())
+
+def recent_episode_titles(n):
+    """Newest-first titles of the last n full (non-trailer) episodes, read from the
+    tail of the cache without copying the archive."""
+    with _episodes_lock:
+        return list(islice((e["title"] for e in reversed(_load_episodes_locked())
+                            if not e.get("is_trailer")), n))
 
 def save_episode(entry):
-    eps = load_episodes()
-    eps.append(entry)
-    EPISODES_JSON.write_text(json.dumps(eps, indent=2))
+    line = orjson.dumps(entry) + b"\n"
+    with _episodes_lock:
+        eps = _load_episodes_locked()
+        before = _episodes_cache["stat"]
+        with open(EPISODES_LOG, "ab") as f:
+            f.write(line)
+        eps.append(entry)
+        st = EPISODES_LOG.stat()
+        # Only trust the cache if nobody else appended in between
+        if before is not None and st.st_size == before[1] + len(line):
+            _episodes_cache["stat"] = (st.st_mtime_ns, st.st_size)
+        else:
+            _episodes_cache["stat"] = None
     try:
         build_feed()
     except Exception as e:
         print(f"Feed build failed (non-fatal): {e}")
 
+def remove_episode(ep_id):
+    """Drop an episode from the store and return its entry, or None if unknown."""
+    with _episodes_lock:
+        eps = _load_episodes_locked()
+        kept, target = [], None
+        for e in eps:
+            if e.get("id") == ep_id:
+                target = e
+            else:
+                kept.append(e)
+        if target is None:
+            return None
+        eps = kept
+        _atomic_write_bytes(EPISODES_LOG, b"".join(orjson.dumps(e) + b"\n" for e in eps))
+        _episodes_cache.update(stat=None, data=eps)
+        return target
+
+_migrate_legacy_episodes()
+
 # ---------------------------------------------------------------------------
 # BACKGROUND WORKERS
 # ---------------------------------------------------------------------------
 
+# Bounded pool for queued generate/chat/series jobs; extra jobs wait as "queued"
+JOB_WORKERS = 8
+JOB_EXECUTOR = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix="job")
+
+def shutdown_jobs():
+    """Drop jobs that have not started and flush job and engagement state. Called
+    from gunicorn's worker_exit hook (gunicorn.conf.py): the interpreter joins the
+    pool's threads before atexit handlers run, so waiting for exit would start
+    every queued job first."""
+    JOB_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    _flush_jobs_at_exit()
+    _flush_engagement()
+
 def _run_generate(job_id, topic_data, depth, voice_alex, voice_morgan, is_trailer, production_brief):
     try:
         update_job(job_id, status="running", progress="Connecting to voice service...")
@@ -866,11 +1732,8 @@ def _run_generate(job_id, topic_data, depth, voice_alex, voice_morgan, is_traile
         update_job(job_id, progress=f"Generating audio ({len(script)} segments)...")
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         ep_type = "trailer" if is_trailer else "episode"
-        ep_id = f"briefing-{ep_type}-{timestamp}"
-        ep_dir = EPISODES_DIR / ep_id
-        final_path = generate_episode_audio(client, script, ep_dir, voice_a_id, voice_b_id)
-        dest = EPISODES_DIR / f"{ep_id}.mp3"
-        shutil.copy2(final_path, dest)
+        ep_id = f"briefing-{ep_type}-{timestamp}-{uuid.uuid4().hex[:6]}"
+        _, file_size = generate_episode_audio(client, script, ep_id, voice_a_id, voice_b_id)
 
         label = "Trailer" if is_trailer else depth.title()
         entry = {
@@ -878,7 +1741,7 @@ def _run_generate(job_id, topic_data, depth, voice_alex, voice_morgan, is_traile
             "title": f"{'[Trailer] ' if is_trailer else ''}Briefing: {topic_data['title']}",
             "description": topic_data.get("tension", ""),
             "file": f"{ep_id}.mp3",
-            "file_size": dest.stat().st_size,
+            "file_size": file_size,
             "depth": label,
             "is_trailer": is_trailer,
             "sources": sources,
@@ -911,11 +1774,8 @@ def _run_chat(job_id, message, existing_topics, voice_alex, voice_morgan):
             update_job(job_id, status="error", error="Voice not found"); return
 
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        ep_id = f"briefing-chat-{timestamp}"
-        ep_dir = EPISODES_DIR / ep_id
-        final_path = generate_episode_audio(client, script, ep_dir, voice_a_id, voice_b_id)
-        dest = EPISODES_DIR / f"{ep_id}.mp3"
-        shutil.copy2(final_path, dest)
+        ep_id = f"briefing-chat-{timestamp}-{uuid.uuid4().hex[:6]}"
+        _, file_size = generate_episode_audio(client, script, ep_id, voice_a_id, voice_b_id)
         log_production()
 
         entry = {
@@ -923,7 +1783,7 @@ def _run_chat(job_id, message, existing_topics, voice_alex, voice_morgan):
             "title": f"[Chat] {topic['title']}",
             "description": topic["tension"],
             "file": f"{ep_id}.mp3",
-            "file_size": dest.stat().st_size,
+            "file_size": file_size,
             "depth": "Standard",
             "is_trailer": False,
             "sources": sources,
@@ -940,12 +1800,8 @@ def _run_chat(job_id, message, existing_topics, voice_alex, voice_morgan):
 
 def _run_create_series(series_id, topic_or_prompt, num_episodes, voice_alex, voice_morgan):
     try:
-        series_list = load_series()
-        s = next((x for x in series_list if x["id"] == series_id), None)
-        if not s: return
-
-        s["status"] = "outlining"
-        save_series(series_list)
+        if not update_series(series_id, status="outlining"):
+            return
         episodes = generate_series_outline(topic_or_prompt, num_episodes)
 
         job_ids = []
@@ -953,31 +1809,16 @@ def _run_create_series(series_id, topic_or_prompt, num_episodes, voice_alex, voi
             jid = create_job("series_ep", series_id=series_id, series_ep=ep["episode_number"])
             job_ids.append(jid)
 
-        series_list = load_series()
-        s = next((x for x in series_list if x["id"] == series_id), None)
-        s["episodes"] = episodes
-        s["job_ids"] = job_ids
-        s["status"] = "producing"
-        s["total"] = len(episodes)
-        s["completed"] = 0
-        save_series(series_list)
+        update_series(series_id, episodes=episodes, job_ids=job_ids, status="producing",
+                      total=len(episodes), completed=0)
 
         _run_series(series_id, episodes, voice_alex, voice_morgan)
 
-        series_list = load_series()
-        s = next((x for x in series_list if x["id"] == series_id), None)
-        if s:
-            s["status"] = "done"
-            save_series(series_list)
+        update_series(series_id, status="done")
 
     except Exception as e:
         import traceback; traceback.print_exc()
-        series_list = load_series()
-        s = next((x for x in series_list if x["id"] == series_id), None)
-        if s:
-            s["status"] = "error"
-            s["error"] = str(e)
-            save_series(series_list)
+        update_series(series_id, status="error", error=str(e))
 
 # ---------------------------------------------------------------------------
 # ROUTES
@@ -1005,14 +1846,10 @@ def api_engagement_log():
 
 @app.route('/api/episodes/<ep_id>', methods=['DELETE'])
 def api_episode_delete(ep_id):
-    eps = load_episodes()
-    target = next((e for e in eps if e.get("id") == ep_id), None)
+    target = remove_episode(ep_id)
     if not target:
         return jsonify({"success": False, "error": "Episode not found"}), 404
 
-    eps = [e for e in eps if e.get("id") != ep_id]
-    EPISODES_JSON.write_text(json.dumps(eps, indent=2))
-
     mp3_path = EPISODES_DIR / target.get("file", "")
     if mp3_path.exists():
         try:
@@ -1077,13 +1914,13 @@ def api_health():
         result["elevenlabs"] = {"status": "missing_key", "warning": True}
     else:
         try:
-            import urllib.request as ur
-            req = ur.Request(
+            resp = _HTTP.get(
                 "https://api.elevenlabs.io/v1/user/subscription",
-                headers={"xi-api-key": ELEVEN_API_KEY}
+                headers={"xi-api-key": ELEVEN_API_KEY},
+                timeout=10,
             )
-            with ur.urlopen(req, timeout=10) as resp:
-                sub = json.loads(resp.read())
+            resp.raise_for_status()
+            sub = orjson.loads(resp.content)
             used = sub.get("character_count", 0)
             limit = sub.get("character_limit", 0)
             remaining = limit - used
@@ -1099,7 +1936,7 @@ def api_health():
                 "tier": sub.get("tier", "unknown"),
             }
         except Exception as e:
-            status_code = getattr(e, 'code', None)
+            status_code = getattr(getattr(e, 'response', None), 'status_code', None)
             if status_code == 401:
                 result["elevenlabs"] = {"status": "invalid_key", "warning": True}
             else:
@@ -1139,16 +1976,22 @@ def listener():
 
 @app.route('/episodes/<path:filename>')
 def serve_episode(filename):
-    return send_from_directory(EPISODES_DIR, filename)
+    # Episode ids carry a random suffix, so an MP3 at a given URL never changes
+    resp = send_from_directory(_EPISODES_ROOT, filename, max_age=31536000)
+    resp.cache_control.immutable = True
+    return resp
 
 @app.route('/feed.xml')
 def serve_feed():
-    try:
-        build_feed()
-    except Exception as e:
-        print(f"Feed rebuild failed: {e}")
+    # Write paths keep feed.xml current; rebuild only if it is missing or stale
+    if not feed_is_current():
+        try:
+            build_feed()
+        except Exception as e:
+            print(f"Feed rebuild failed: {e}")
     if FEED_FILE.exists():
-        return send_from_directory(DATA_DIR, 'feed.xml', mimetype='application/rss+xml')
+        return send_from_directory(DATA_DIR, 'feed.xml', mimetype='application/rss+xml',
+                                   etag=get_feed_etag() or True, max_age=300)
     return "No episodes yet.", 404
 
 # --- Admin ---
@@ -1156,8 +1999,8 @@ def serve_feed():
 @app.route('/api/queue', methods=['GET'])
 def api_queue_status():
     jobs = get_all_jobs()
-    active = [j for j in jobs.values() if j["status"] in ("queued", "running")]
-    active.sort(key=lambda j: j["created_at"])
+    active = sorted((j for j in jobs.values() if j["status"] in ("queued", "running")),
+                    key=lambda j: j["created_at"])
     return jsonify({"active": active, "total_active": len(active)})
 
 @app.route('/api/queue/clear', methods=['POST'])
@@ -1168,7 +2011,7 @@ def api_queue_clear():
 @app.route('/api/feed/rebuild', methods=['POST'])
 def api_feed_rebuild():
     try:
-        build_feed()
+        build_feed(force=True)
         ep_count = len([e for e in load_episodes() if not e.get("is_trailer")])
         return jsonify({"success": True, "episodes_in_feed": ep_count})
     except Exception as e:
@@ -1188,13 +2031,12 @@ def api_autoqueue():
 
 @app.route('/api/discover/suggestions', methods=['GET'])
 def api_discover_suggestions():
-    SUGGESTIONS_CACHE = DATA_DIR / "suggestions_cache.json"
     today = date.today().isoformat()
     force = request.args.get("refresh", "").lower() == "true"
 
     if not force and SUGGESTIONS_CACHE.exists():
         try:
-            cached = json.loads(SUGGESTIONS_CACHE.read_text())
+            cached = _jloads(SUGGESTIONS_CACHE)
             if cached.get("date") == today:
                 topics_mtime = TOPICS_CACHE.stat().st_mtime if TOPICS_CACHE.exists() else 0
                 suggestions_mtime = SUGGESTIONS_CACHE.stat().st_mtime
@@ -1205,90 +2047,8 @@ def api_discover_suggestions():
         except Exception:
             pass
 
-    today_topics = []
-    if TOPICS_CACHE.exists():
-        try:
-            tc = json.loads(TOPICS_CACHE.read_text())
-            if tc.get("date") == today:
-                today_topics = [t["title"] for t in tc.get("topics", [])]
-        except Exception:
-            pass
-
-    eps = load_episodes()
-    commissioned = [e["title"] for e in eps if not e.get("is_trailer")][-30:]
-    series_list = load_series()
-    series_titles = [s["title"] for s in series_list]
-    all_exclusions = list(set(today_topics + commissioned))
-
-    exclusion_block = "\n".join(f"- {t}" for t in all_exclusions) if all_exclusions else "None yet."
-    series_block = "\n".join(f"- {t}" for t in series_titles) if series_titles else "None yet."
-
-    eng = get_engagement_summary()
-    strong_block = "\n".join(f"- {t}" for t in eng.get("strong_interest", [])) or "None yet."
-    moderate_block = "\n".join(f"- {t}" for t in eng.get("moderate_interest", [])) or "None yet."
-    dismissed_block = "\n".join(f"- {t}" for t in eng.get("dismissed", [])) or "None yet."
-
-    prompt = f"""You are an editorial intelligence engine for a senior analytics/AI executive (CAO at Overproof, former VP Analytics at Diageo North America).
-
-Generate 10 high-signal topic ideas that are NEW and DISTINCT from everything already covered.
-
-ALREADY COVERED - DO NOT GENERATE ANYTHING SIMILAR TO THESE:
-{exclusion_block}
-
-SERIES ARCS IN PROGRESS:
-{series_block}
-
-BEHAVIORAL SIGNALS - USE THESE TO CALIBRATE RECOMMENDATIONS:
-Strong interest (listened 75%+ or completed): Generate topics that go DEEPER or adjacent to these.
-{strong_block}
-
-Moderate interest (previewed or partially listened): Good signal for adjacent angles.
-{moderate_block}
-
-Dismissed (explicitly not interested): AVOID topics in this territory.
-{dismissed_block}
-
-EXECUTIVE PROFILE:
-- Thinks in systems, incentives, capital allocation, and moats
-- Enterprise AI: governance, multi-agent systems, ROI measurement
-- Beverage alcohol: three-tier dynamics, venue intelligence, distributor data
-- Org design: CAO/CDO role evolution, analytics talent strategy
-- Active C-suite job seeker: CAO, CDO, VP Analytics
-
-RULES:
-- Every topic must be meaningfully distinct from the exclusion list
-- Weight toward strong_interest adjacencies - these are proven signals
-- Do NOT generate anything in the dismissed territory
-- Include 2-3 trending topics from the last 30 days
-- Contrarian angle required - challenges comfortable consensus
-- Zero generic AI hype topics
-
-Return ONLY a valid JSON array of exactly 10 objects, no markdown, no preamble:
-[{{
-  "rank": 1,
-  "title": "provocative but professional title",
-  "tension": "core contrarian thesis in 1-2 sentences",
-  "why_it_matters": "strategic importance for this specific executive in 1 sentence",
-  "freshness": "evergreen | trending | time-sensitive",
-  "confidence_rationale": "1 sentence: why this maps to your demonstrated interests"
-}}]"""
-
     try:
-        try:
-            data = call_anthropic([{"role": "user", "content": prompt}], max_tokens=3000, use_web_search=True)
-        except Exception as ws_err:
-            print(f"[SUGGESTIONS] Web search failed ({ws_err}), falling back")
-            data = call_anthropic([{"role": "user", "content": prompt}], max_tokens=3000, use_web_search=False)
-
-        text = extract_text(data).strip()
-        if "```" in text:
-            text = text.split("```")[1]
-            if text.startswith("json"): text = text[4:]
-        bracket = text.find("[")
-        if bracket > 0:
-            text = text[bracket:]
-        suggestions = json.loads(text)[:10]
-        SUGGESTIONS_CACHE.write_text(json.dumps({"date": today, "suggestions": suggestions}, indent=2))
+        suggestions = generate_suggestions(today)
         return jsonify({"suggestions": suggestions, "cached": False})
     except Exception as e:
         import traceback; traceback.print_exc()
@@ -1296,6 +2056,17 @@ Return ONLY a valid JSON array of exactly 10 objects, no markdown, no preamble:
         return jsonify({"suggestions": [], "error": str(e), "cached": False}), 500
 
 
+def cron_authorized():
+    """?secret= or a Bearer token, compared in constant time. Open when CRON_SECRET is unset."""
+    if not CRON_SECRET:
+        return True
+    secret = request.args.get("secret")
+    if not secret:
+        header = request.headers.get("Authorization", "")
+        secret = header[7:] if header.startswith("Bearer ") else header
+    return hmac.compare_digest(secret.encode(), CRON_SECRET.encode())
+
+
 @app.route('/api/cron/nightly-trailers', methods=['GET', 'POST'])
 def api_cron_nightly_trailers():
     """
@@ -1303,17 +2074,16 @@ def api_cron_nightly_trailers():
     Cron-job.org URL: /api/cron/nightly-trailers?secret=YOUR_CRON_SECRET
     Recommended: Daily at 22:00 America/Chicago
     """
-    secret = request.args.get("secret") or request.headers.get("Authorization", "").replace("Bearer ", "")
-    if CRON_SECRET and secret != CRON_SECRET:
+    if not cron_authorized():
         return jsonify({"success": False, "error": "Unauthorized"}), 401
 
     force = request.args.get("force", "").lower() == "true"
-    TRAILER_QUEUE_LOG = DATA_DIR / "nightly_trailer_log.json"
     today = date.today().isoformat()
+    now_iso = datetime.now(timezone.utc).isoformat()
 
     if not force and TRAILER_QUEUE_LOG.exists():
         try:
-            log = json.loads(TRAILER_QUEUE_LOG.read_text())
+            log = _jloads(TRAILER_QUEUE_LOG)
             if log.get("date") == today:
                 return jsonify({"success": True, "skipped": True,
                                 "reason": "Already ran today", "job_ids": log.get("job_ids", [])})
@@ -1323,86 +2093,30 @@ def api_cron_nightly_trailers():
     if not ANTHROPIC_API_KEY or not ELEVEN_API_KEY:
         return jsonify({"success": False, "error": "API keys not configured"}), 500
 
-    today_topics_list = []
-    if TOPICS_CACHE.exists():
-        try:
-            tc = json.loads(TOPICS_CACHE.read_text())
-            if tc.get("date") == today:
-                today_topics_list = [t["title"] for t in tc.get("topics", [])]
-        except Exception:
-            pass
-
-    eps = load_episodes()
-    commissioned_titles = [e["title"] for e in eps if not e.get("is_trailer")][-20:]
-    series_list = load_series()
-    series_titles = [s["title"] for s in series_list]
-    all_exclusions = list(set(today_topics_list + commissioned_titles))
-
-    exclusion_block = "\n".join(f"- {t}" for t in all_exclusions) if all_exclusions else "None yet."
-    series_block = "\n".join(f"- {t}" for t in series_titles) if series_titles else "None yet."
-
-    eng = get_engagement_summary()
-    strong_block = "\n".join(f"- {t}" for t in eng.get("strong_interest", [])) or "None yet."
-    moderate_block = "\n".join(f"- {t}" for t in eng.get("moderate_interest", [])) or "None yet."
-    dismissed_block = "\n".join(f"- {t}" for t in eng.get("dismissed", [])) or "None yet."
-
-    prompt = f"""You are a high-precision editorial recommender for a senior analytics/AI executive (CAO at Overproof, former VP Analytics Diageo North America).
-
-Your task: Generate exactly 6 topic candidates for overnight trailer production.
-
-ALREADY COVERED - DO NOT GENERATE ANYTHING SIMILAR:
-{exclusion_block}
-
-SERIES ARCS IN PROGRESS:
-{series_block}
-
-BEHAVIORAL SIGNALS (actual listen data - weight these heavily):
-Strong interest - listened 75%+ or completed:
-{strong_block}
-
-Moderate interest - previewed or partial listen:
-{moderate_block}
-
-Dismissed - explicitly rejected. Stay away:
-{dismissed_block}
-
-EXECUTIVE PROFILE:
-- Ed Dobbles, CAO at Overproof (beverage alcohol AI/analytics)
-- Former VP Advanced Analytics, Diageo North America
-- Building multi-agent AI governance frameworks
-- Enterprise deals with Heineken, Beam Suntory, Diageo
-- Thinks in systems, incentives, moats, capital allocation
-
-CONSTRAINTS:
-- All 6 must clear a HIGH confidence bar
-- Topics near strong_interest adjacencies get priority
-- NEVER generate anything in the dismissed territory
-- Mix: 2-3 enterprise AI/governance, 1-2 beverage alcohol/CPG, 1-2 org/talent/career
-- At least 2 TIME-SENSITIVE topics (next 30 days)
+    exclusion_block, series_block, strong_block, moderate_block, dismissed_block = \
+        editorial_blocks(build_editorial_context(today), recent=20)
 
-Return ONLY a valid JSON array of exactly 6 objects, no markdown:
-[{{
-  "rank": 1,
-  "title": "provocative but professional title",
-  "tension": "core contrarian thesis in 1-2 sentences",
-  "why_it_matters": "strategic importance in 1 sentence",
-  "common_mistake": "what sophisticated leaders get wrong",
-  "sub_questions": ["question 1", "question 2", "question 3"],
-  "trailer_hook": "3-4 sentence spoken-word hook, direct to a peer executive",
-  "confidence_score": 85,
-  "confidence_rationale": "1-2 sentences: specific reason this is high-confidence"
-}}]"""
+    prompt = NIGHTLY_TRAILER_PROMPT.format_map({
+        "exclusion_block": exclusion_block, "series_block": series_block,
+        "strong_block": strong_block, "moderate_block": moderate_block,
+        "dismissed_block": dismissed_block,
+        "output_spec": _TRAILER_TOPICS_OUTPUT_LEGACY if LEGACY_JSON_PARSING else _TRAILER_TOPICS_OUTPUT,
+    })
 
+    tools = None if LEGACY_JSON_PARSING else [TRAILER_TOPICS_TOOL]
     try:
-        data = call_anthropic([{"role": "user", "content": prompt}], max_tokens=3000, use_web_search=True)
-    except Exception:
-        data = call_anthropic([{"role": "user", "content": prompt}], max_tokens=3000, use_web_search=False)
-
-    text = extract_text(data).strip()
-    if text.startswith("```"):
-        text = text.split("```")[1]
-        if text.startswith("json"): text = text[4:]
-    trailer_topics = json.loads(text)[:6]
+        messages = [{"role": "user", "content": prompt}]
+        data = call_anthropic_searching(messages, "NIGHTLY",
+                                        max_tokens=3000, tools=tools, timeout=EDITORIAL_SEARCH_TIMEOUT)
+        if tools:
+            trailer_topics = forced_tool_input(messages, data, TRAILER_TOPICS_TOOL, "NIGHTLY",
+                                               max_tokens=3000)["topics"][:6]
+        else:
+            trailer_topics = _extract_json_array(extract_text(data))[:6]
+    except Exception as e:
+        # No run log is written, so re-triggering this endpoint can still run tonight
+        print(f"[NIGHTLY] Topic generation failed, no trailers queued: {type(e).__name__}: {e}")
+        return jsonify({"success": False, "error": f"Topic generation failed: {e}"}), 502
 
     job_ids = []
     voice_alex = "Chris - Charming, Down-to-Earth"
@@ -1410,34 +2124,31 @@ Return ONLY a valid JSON array of exactly 6 objects, no markdown:
 
     for topic in trailer_topics:
         jid = create_job("generate")
-        threading.Thread(
-            target=_run_generate,
-            args=(jid, topic, "executive", voice_alex, voice_morgan, True, ""),
-            daemon=True
-        ).start()
+        JOB_EXECUTOR.submit(_run_generate, jid, topic, "executive", voice_alex, voice_morgan, True, "")
         job_ids.append({"job_id": jid, "title": topic["title"], "confidence": topic.get("confidence_score", 0)})
 
-    TRAILER_QUEUE_LOG.write_text(json.dumps({
+    _jdumps(TRAILER_QUEUE_LOG, {
         "date": today,
-        "run_at": datetime.now(timezone.utc).isoformat(),
+        "run_at": now_iso,
         "job_ids": job_ids,
         "topics": trailer_topics,
-    }, indent=2))
+    })
 
     print(f"[NIGHTLY] Queued {len(job_ids)} trailers")
     return jsonify({"success": True, "queued": len(job_ids), "job_ids": job_ids,
-                    "triggered_at": datetime.now(timezone.utc).isoformat()})
+                    "triggered_at": now_iso})
 
 
 @app.route('/api/cron/nightly-trailers/status', methods=['GET'])
 def api_nightly_trailer_status():
-    TRAILER_QUEUE_LOG = DATA_DIR / "nightly_trailer_log.json"
     if not TRAILER_QUEUE_LOG.exists():
         return jsonify({"run": None})
     try:
-        log = json.loads(TRAILER_QUEUE_LOG.read_text())
-        for item in log.get("job_ids", []):
-            j = get_job(item["job_id"])
+        log = _jloads(TRAILER_QUEUE_LOG)
+        items = log.get("job_ids", [])
+        jobs = get_jobs_bulk([item["job_id"] for item in items])
+        for item in items:
+            j = jobs.get(item["job_id"])
             item["status"] = j["status"] if j else "unknown"
         return jsonify({"run": log})
     except Exception as e:
@@ -1451,8 +2162,7 @@ def api_cron_autoqueue():
     Recommended schedule: Daily at 06:00 America/Chicago
     URL: /api/cron/autoqueue?secret=YOUR_CRON_SECRET
     """
-    secret = request.args.get("secret") or request.headers.get("Authorization", "").replace("Bearer ", "")
-    if CRON_SECRET and secret != CRON_SECRET:
+    if not cron_authorized():
         return jsonify({"success": False, "error": "Unauthorized"}), 401
 
     if not ANTHROPIC_API_KEY or not ELEVEN_API_KEY:
@@ -1480,18 +2190,17 @@ def api_cron_morning_prep():
     Recommended: Daily at 05:30 America/Chicago (11:30 UTC)
     URL: /api/cron/morning-prep?secret=YOUR_CRON_SECRET
     """
-    secret = request.args.get("secret") or request.headers.get("Authorization", "").replace("Bearer ", "")
-    if CRON_SECRET and secret != CRON_SECRET:
+    if not cron_authorized():
         return jsonify({"success": False, "error": "Unauthorized"}), 401
 
     force = request.args.get("force", "").lower() == "true"
-    MORNING_PREP_LOG = DATA_DIR / "morning_prep_log.json"
     today = date.today().isoformat()
+    now_iso = datetime.now(timezone.utc).isoformat()
 
     # Idempotency: don't run twice in one day
     if not force and MORNING_PREP_LOG.exists():
         try:
-            log = json.loads(MORNING_PREP_LOG.read_text())
+            log = _jloads(MORNING_PREP_LOG)
             if log.get("date") == today:
                 return jsonify({"success": True, "skipped": True,
                                 "reason": "Already ran today", "cached_at": log.get("run_at")})
@@ -1510,89 +2219,8 @@ def api_cron_morning_prep():
         print(f"[MORNING PREP] Topics failed: {e}")
 
     # Step 2: Pre-warm suggestions cache
-    SUGGESTIONS_CACHE = DATA_DIR / "suggestions_cache.json"
     try:
-        today_topics = []
-        if TOPICS_CACHE.exists():
-            try:
-                tc = json.loads(TOPICS_CACHE.read_text())
-                if tc.get("date") == today:
-                    today_topics = [t["title"] for t in tc.get("topics", [])]
-            except Exception:
-                pass
-
-        eps = load_episodes()
-        commissioned = [e["title"] for e in eps if not e.get("is_trailer")][-30:]
-        series_list = load_series()
-        series_titles = [s["title"] for s in series_list]
-        all_exclusions = list(set(today_topics + commissioned))
-
-        exclusion_block = "\n".join(f"- {t}" for t in all_exclusions) if all_exclusions else "None yet."
-        series_block = "\n".join(f"- {t}" for t in series_titles) if series_titles else "None yet."
-        eng = get_engagement_summary()
-        strong_block = "\n".join(f"- {t}" for t in eng.get("strong_interest", [])) or "None yet."
-        moderate_block = "\n".join(f"- {t}" for t in eng.get("moderate_interest", [])) or "None yet."
-        dismissed_block = "\n".join(f"- {t}" for t in eng.get("dismissed", [])) or "None yet."
-
-        prompt = f"""You are an editorial intelligence engine for a senior analytics/AI executive (CAO at Overproof, former VP Analytics at Diageo North America).
-
-Generate 10 high-signal topic ideas that are NEW and DISTINCT from everything already covered.
-
-ALREADY COVERED - DO NOT GENERATE ANYTHING SIMILAR TO THESE:
-{exclusion_block}
-
-SERIES ARCS IN PROGRESS:
-{series_block}
-
-BEHAVIORAL SIGNALS - USE THESE TO CALIBRATE RECOMMENDATIONS:
-Strong interest (listened 75%+ or completed): Generate topics that go DEEPER or adjacent to these.
-{strong_block}
-
-Moderate interest (previewed or partially listened): Good signal for adjacent angles.
-{moderate_block}
-
-Dismissed (explicitly not interested): AVOID topics in this territory.
-{dismissed_block}
-
-EXECUTIVE PROFILE:
-- Thinks in systems, incentives, capital allocation, and moats
-- Enterprise AI: governance, multi-agent systems, ROI measurement
-- Beverage alcohol: three-tier dynamics, venue intelligence, distributor data
-- Org design: CAO/CDO role evolution, analytics talent strategy
-- Active C-suite job seeker: CAO, CDO, VP Analytics
-
-RULES:
-- Every topic must be meaningfully distinct from the exclusion list
-- Weight toward strong_interest adjacencies - these are proven signals
-- Do NOT generate anything in the dismissed territory
-- Include 2-3 trending topics from the last 30 days
-- Contrarian angle required - challenges comfortable consensus
-- Zero generic AI hype topics
-
-Return ONLY a valid JSON array of exactly 10 objects, no markdown, no preamble:
-[{{
-  "rank": 1,
-  "title": "provocative but professional title",
-  "tension": "core contrarian thesis in 1-2 sentences",
-  "why_it_matters": "strategic importance for this specific executive in 1 sentence",
-  "freshness": "evergreen | trending | time-sensitive",
-  "confidence_rationale": "1 sentence: why this maps to your demonstrated interests"
-}}]"""
-
-        try:
-            data = call_anthropic([{"role": "user", "content": prompt}], max_tokens=3000, use_web_search=True)
-        except Exception:
-            data = call_anthropic([{"role": "user", "content": prompt}], max_tokens=3000, use_web_search=False)
-
-        text = extract_text(data).strip()
-        if "```" in text:
-            text = text.split("```")[1]
-            if text.startswith("json"): text = text[4:]
-        bracket = text.find("[")
-        if bracket > 0:
-            text = text[bracket:]
-        suggestions = json.loads(text)[:10]
-        SUGGESTIONS_CACHE.write_text(json.dumps({"date": today, "suggestions": suggestions}, indent=2))
+        suggestions = generate_suggestions(today)
         results["suggestions"] = len(suggestions)
         print(f"[MORNING PREP] Suggestions warmed: {len(suggestions)} topics")
     except Exception as e:
@@ -1600,11 +2228,11 @@ Return ONLY a valid JSON array of exactly 10 objects, no markdown, no preamble:
         print(f"[MORNING PREP] Suggestions failed: {e}")
 
     # Log run
-    MORNING_PREP_LOG.write_text(json.dumps({
+    _jdumps(MORNING_PREP_LOG, {
         "date": today,
-        "run_at": datetime.now(timezone.utc).isoformat(),
+        "run_at": now_iso,
         "results": results,
-    }, indent=2))
+    })
 
     success = results["topics"] is not False
     print(f"[MORNING PREP] Complete - topics: {results['topics']}, suggestions: {results['suggestions']}")
@@ -1614,7 +2242,7 @@ Return ONLY a valid JSON array of exactly 10 objects, no markdown, no preamble:
         "topics_cached": results["topics"],
         "suggestions_cached": results["suggestions"],
         "errors": results["errors"],
-        "run_at": datetime.now(timezone.utc).isoformat(),
+        "run_at": now_iso,
     })
 
 
@@ -1655,28 +2283,22 @@ def api_series_create():
         "completed": 0,
         "error": None,
     }
-    series_list = load_series()
-    series_list.append(series_entry)
-    save_series(series_list)
+    add_series(series_entry)
 
-    threading.Thread(
-        target=_run_create_series,
-        args=(series_id, topic_or_prompt, num_episodes, voice_alex, voice_morgan),
-        daemon=True
-    ).start()
+    JOB_EXECUTOR.submit(_run_create_series, series_id, topic_or_prompt, num_episodes, voice_alex, voice_morgan)
 
     return jsonify({"success": True, "series_id": series_id, "title": series_title})
 
 @app.route('/api/series/<series_id>', methods=['GET'])
 def api_series_status(series_id):
-    series = load_series()
-    s = next((x for x in series if x["id"] == series_id), None)
+    s = load_series_by_id(series_id)
     if not s:
         return jsonify({"error": "Series not found"}), 404
     if s.get("job_ids"):
         job_statuses = []
+        jobs = get_jobs_bulk(s["job_ids"])
         for i, jid in enumerate(s["job_ids"]):
-            j = get_job(jid)
+            j = jobs.get(jid)
             ep_title = s["episodes"][i]["title"] if i < len(s.get("episodes", [])) else f"Episode {i+1}"
             job_statuses.append({
                 "episode": i + 1,
@@ -1702,20 +2324,25 @@ def api_voices():
     if not ELEVEN_API_KEY:
         return jsonify({"error": "No API key", "voices": []})
     try:
-        client = get_elevenlabs_client()
-        resp = client.voices.get_all()
-        voices = [{"name": v.name, "voice_id": v.voice_id, "category": v.category or "custom"}
-                  for v in resp.voices]
-        return jsonify({"voices": voices})
+        return jsonify({"voices": get_voice_list(get_elevenlabs_client())})
     except Exception as e:
         return jsonify({"error": str(e), "voices": []})
 
+@app.route('/api/voices/refresh', methods=['POST'])
+def api_voices_refresh():
+    if not ELEVEN_API_KEY:
+        return jsonify({"success": False, "error": "No API key"})
+    try:
+        voices = get_voice_list(get_elevenlabs_client(), refresh=True)
+        return jsonify({"success": True, "voice_count": len(voices)})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)})
+
 @app.route('/api/episodes')
 def api_episodes():
     eps = load_episodes()
-    trailers = [e for e in eps if e.get("is_trailer")]
-    full = [e for e in eps if not e.get("is_trailer")]
-    return jsonify({"episodes": eps, "full_count": len(full), "trailer_count": len(trailers)})
+    trailer_count = sum(1 for e in eps if e.get("is_trailer"))
+    return jsonify({"episodes": eps, "full_count": len(eps) - trailer_count, "trailer_count": trailer_count})
 
 @app.route('/api/topics')
 def api_topics():
@@ -1724,7 +2351,7 @@ def api_topics():
         week_count = productions_this_week()
         return jsonify({"topics": topics, "productions_this_week": week_count, "weekly_cap": WEEKLY_CAP})
     except Exception as e:
-        return jsonify({"error": str(e), "topics": FALLBACK_TOPICS,
+        return jsonify({"error": str(e), "topics": get_fallback_topics(),
                         "productions_this_week": 0, "weekly_cap": WEEKLY_CAP})
 
 @app.route('/api/chat', methods=['POST'])
@@ -1743,11 +2370,7 @@ def api_chat():
         return jsonify({"success": False, "error": "ElevenLabs API key not configured"})
 
     job_id = create_job("chat")
-    threading.Thread(
-        target=_run_chat,
-        args=(job_id, message, existing_topics, voice_alex, voice_morgan),
-        daemon=True
-    ).start()
+    JOB_EXECUTOR.submit(_run_chat, job_id, message, existing_topics, voice_alex, voice_morgan)
     return jsonify({"success": True, "job_id": job_id, "status": "queued"})
 
 @app.route('/api/generate', methods=['POST'])
@@ -1772,11 +2395,8 @@ def api_generate():
                       "trailer_hook": data.get("trailer_hook", topic_title)}
 
     job_id = create_job("generate")
-    threading.Thread(
-        target=_run_generate,
-        args=(job_id, topic_data, depth, voice_alex, voice_morgan, is_trailer, production_brief),
-        daemon=True
-    ).start()
+    JOB_EXECUTOR.submit(_run_generate, job_id, topic_data, depth, voice_alex, voice_morgan,
+                        is_trailer, production_brief)
     return jsonify({"success": True, "job_id": job_id, "status": "queued"})
 
 if __name__ == '__main__':
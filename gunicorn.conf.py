@@ -0,0 +1,7 @@
+# Loaded automatically by gunicorn from the working directory (Procfile and Dockerfile).
+
+
+def worker_exit(server, worker):
+    # Runs in the worker process before the interpreter joins the job pool's threads
+    from app import shutdown_jobs
+    shutdown_jobs()
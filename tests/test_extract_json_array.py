@@ -0,0 +1,30 @@
+import os
+import tempfile
+import unittest
+
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp())
+
+from app import _extract_json_array
+
+
+class ExtractJsonArrayTest(unittest.TestCase):
+    def test_bare_array(self):
+        self.assertEqual(_extract_json_array('[{"a": 1}]'), [{"a": 1}])
+
+    def test_prose_around_bare_array(self):
+        self.assertEqual(_extract_json_array('Here you go:\n[{"a": [1, 2]}]\nDone.'), [{"a": [1, 2]}])
+
+    def test_fenced_array(self):
+        self.assertEqual(_extract_json_array('```json\n[{"a": 1}]\n```'), [{"a": 1}])
+
+    def test_prose_bracket_before_fenced_array(self):
+        text = 'Topics [draft] below:\n```json\n[{"a": 1}]\n```\nSee [1] for sources.'
+        self.assertEqual(_extract_json_array(text), [{"a": 1}])
+
+    def test_no_array(self):
+        with self.assertRaises(ValueError):
+            _extract_json_array("no array here")
+
+
+if __name__ == "__main__":
+    unittest.main()